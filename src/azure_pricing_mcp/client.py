@@ -1,8 +1,10 @@
 """HTTP client for Azure Pricing API."""
 
 import asyncio
+import json
 import logging
 import ssl
+from collections.abc import Callable
 from typing import Any
 
 import aiohttp
@@ -10,6 +12,8 @@ import aiohttp
 from .config import (
     AZURE_PRICING_BASE_URL,
     DEFAULT_API_VERSION,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_DNS_CACHE_TTL,
     MAX_RESULTS_PER_REQUEST,
     MAX_RETRIES,
     RATE_LIMIT_RETRY_BASE_WAIT,
@@ -18,6 +22,15 @@ from .config import (
 
 logger = logging.getLogger(__name__)
 
+# Azure API responses can run to megabytes; decode them with orjson when the
+# optional "fast" extra is installed, otherwise fall back to the stdlib
+try:
+    import orjson
+
+    json_loads: Callable[[str], Any] = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    json_loads = json.loads
+
 
 class AzurePricingClient:
     """HTTP client for Azure Pricing API with retry logic."""
@@ -29,14 +42,16 @@ class AzurePricingClient:
 
     async def __aenter__(self) -> "AzurePricingClient":
         """Async context manager entry."""
-        connector = None
+        ssl_context: ssl.SSLContext | bool = True
         if not SSL_VERIFY:
             # Create SSL context that doesn't verify certificates
             ssl_context = ssl.create_default_context()
             ssl_context.check_hostname = False
             ssl_context.verify_mode = ssl.CERT_NONE
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
             logger.warning("SSL verification is disabled. This is insecure and should only be used for debugging.")
+        # All requests go to a handful of hosts, so keep resolved addresses and
+        # allow enough pooled connections for concurrent region/SKU lookups
+        connector = aiohttp.TCPConnector(ssl=ssl_context, limit=HTTP_CONNECTION_LIMIT, ttl_dns_cache=HTTP_DNS_CACHE_TTL)
         self.session = aiohttp.ClientSession(connector=connector)
         return self
 
@@ -85,7 +100,7 @@ class AzurePricingClient:
                             response.raise_for_status()
 
                     response.raise_for_status()
-                    json_data: dict[str, Any] = await response.json()
+                    json_data: dict[str, Any] = await response.json(loads=json_loads)
                     return json_data
 
             except aiohttp.ClientResponseError as e:
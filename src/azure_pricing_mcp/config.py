@@ -13,6 +13,13 @@ MAX_RETRIES = 3
 RATE_LIMIT_RETRY_BASE_WAIT = 5  # seconds
 DEFAULT_CUSTOMER_DISCOUNT = 10.0  # percent
 
+# HTTP connection pool configuration
+HTTP_CONNECTION_LIMIT = 64
+HTTP_DNS_CACHE_TTL = 300  # seconds
+# Cap on concurrent Retail Prices API requests fanned out by one service call;
+# aiohttp throughput degrades well before the connection pool limit is reached
+MAX_CONCURRENT_PRICE_REQUESTS = 16
+
 # SSL verification configuration
 # Set to False if behind a corporate proxy with self-signed certificates
 # Can also be set via environment variable AZURE_PRICING_SSL_VERIFY=false
@@ -1,6 +1,7 @@
 """Response formatters for Azure Pricing MCP Server."""
 
 import json
+from collections import defaultdict
 from typing import Any
 
 from azure_pricing_mcp.config import DEFAULT_CUSTOMER_DISCOUNT
@@ -15,6 +16,13 @@ DISCOUNT_TIP_NO_DISCOUNT = (
     "to apply your organization's negotiated discount rate."
 )
 
+# Orphaned resources report for a scan that found nothing
+NO_ORPHANS_MESSAGE = (
+    "### ✅ No Orphaned Resources Found\n\n"
+    "Scanned {subscription_count} subscription(s) — "
+    "no orphaned disks, NICs, public IPs, NSGs, or empty App Service Plans detected."
+)
+
 
 def _get_discount_tip(result: dict[str, Any]) -> str:
     """Get appropriate discount tip based on metadata.
@@ -626,50 +634,59 @@ def format_orphaned_resources_response(result: dict[str, Any]) -> str:
 
     subscriptions = result.get("subscriptions", [])
     total_orphaned = result.get("total_orphaned", 0)
+    scanned_count = result.get("subscriptions_scanned", len(subscriptions))
+
+    # Some Resource Graph queries failed, so a missing orphan may just be unscanned
+    warning_lines = []
+    if result.get("partial"):
+        warning_lines.append(
+            "⚠️ **Incomplete scan:** some subscriptions could not be queried, so orphans may be missing."
+        )
+        for error in result.get("errors", []):
+            warning_lines.append(f"- {error}")
+        warning_lines.append("")
+
+    # Clean tenants are the common case; skip all report building for them
+    if total_orphaned == 0:
+        if warning_lines:
+            return "\n".join(["### ⚠️ Orphaned Resource Scan Incomplete\n", *warning_lines, result.get("note", "")])
+        return NO_ORPHANS_MESSAGE.format(subscription_count=scanned_count)
+
     total_cost = result.get("total_estimated_cost", 0.0)
     lookback = result.get("lookback_days", 60)
     currency = result.get("currency", "USD")
+    # Without a cost lookup the totals are unknown, not zero
+    cost_skipped = result.get("cost_skipped", False)
+    total_cost_str = "N/A (cost lookup skipped)" if cost_skipped else f"${total_cost:,.2f} {currency}"
 
-    if total_orphaned == 0:
-        return (
-            "### ✅ No Orphaned Resources Found\n\n"
-            f"Scanned {len(subscriptions)} subscription(s) — "
-            "no orphaned disks, NICs, public IPs, NSGs, or empty App Service Plans detected."
-        )
-
-    # Collect all orphaned resources across subscriptions
-    all_orphaned: list[dict[str, Any]] = []
+    # Group all orphaned resources across subscriptions by orphan type, totalling cost in the same pass
+    by_type: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    type_costs: defaultdict[str, float] = defaultdict(float)
     for sub in subscriptions:
-        all_orphaned.extend(sub.get("orphaned_resources", []))
-
-    # Group by orphan type
-    by_type: dict[str, list[dict[str, Any]]] = {}
-    for resource in all_orphaned:
-        res_type = resource.get("orphan_type", "Unknown")
-        if res_type not in by_type:
-            by_type[res_type] = []
-        by_type[res_type].append(resource)
+        for resource in sub.get("orphaned_resources", []):
+            res_type = resource.get("orphan_type", "Unknown")
+            by_type[res_type].append(resource)
+            type_costs[res_type] += resource.get("estimated_cost_usd") or 0.0
+    sorted_types = sorted(by_type.items())
 
     response_lines = [
         "### 🔍 Orphaned Resource Report\n",
+        *warning_lines,
         f"**Total orphaned resources:** {total_orphaned}",
-        f"**Estimated wasted cost ({lookback} days):** ${total_cost:,.2f} {currency}",
-        f"**Subscriptions scanned:** {len(subscriptions)}\n",
+        f"**Estimated wasted cost ({lookback} days):** {total_cost_str}",
+        f"**Subscriptions scanned:** {scanned_count}\n",
+        # Per-type summary table
+        "#### Summary by Type\n",
+        "| Resource Type | Count | Est. Cost |",
+        "|---------------|-------|-----------|",
     ]
-
-    # Per-type summary table
-    response_lines.append("#### Summary by Type\n")
-    response_lines.append("| Resource Type | Count | Est. Cost |")
-    response_lines.append("|---------------|-------|-----------|")
-    for rtype in sorted(by_type.keys()):
-        resources = by_type[rtype]
-        type_cost = sum(r.get("estimated_cost_usd") or 0.0 for r in resources)
-        response_lines.append(f"| {rtype} | {len(resources)} | ${type_cost:,.2f} |")
+    for rtype, resources in sorted_types:
+        type_cost_str = "N/A" if cost_skipped else f"${type_costs[rtype]:,.2f}"
+        response_lines.append(f"| {rtype} | {len(resources)} | {type_cost_str} |")
     response_lines.append("")
 
     # Detail per type
-    for rtype in sorted(by_type.keys()):
-        resources = by_type[rtype]
+    for rtype, resources in sorted_types:
         response_lines.append(f"#### {rtype} ({len(resources)})\n")
         response_lines.append("| Name | Resource Group | Location | Cost |")
         response_lines.append("|------|----------------|----------|------|")
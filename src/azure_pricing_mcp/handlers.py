@@ -1,5 +1,6 @@
 """Tool handlers for Azure Pricing MCP Server."""
 
+import json
 import logging
 from typing import Any
 
@@ -177,6 +178,13 @@ class ToolHandlers:
             self._orphaned_service = OrphanedResourcesService()
         return self._orphaned_service
 
+    async def aclose(self) -> None:
+        """Close HTTP sessions held by lazily created services."""
+        if self._spot_service is not None:
+            await self._spot_service.aclose()
+        if self._orphaned_service is not None:
+            await self._orphaned_service.aclose()
+
     async def handle_spot_eviction_rates(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle spot_eviction_rates tool calls."""
         spot_service = self._get_spot_service()
@@ -213,8 +221,12 @@ class ToolHandlers:
         result = await orphaned_service.find_orphaned_resources(
             days=arguments.get("days", 60),
             all_subscriptions=arguments.get("all_subscriptions", True),
+            skip_cost=arguments.get("skip_cost", False),
         )
-        response_text = format_orphaned_resources_response(result)
+        if arguments.get("format") == "json":
+            response_text = json.dumps(result, indent=2)
+        else:
+            response_text = format_orphaned_resources_response(result)
         return [TextContent(type="text", text=response_text)]
 
 
@@ -54,7 +54,8 @@ class AzurePricingServer:
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit - closes the HTTP session."""
+        """Async context manager exit - closes the HTTP sessions."""
+        await self._tool_handlers.aclose()
         if self._session_active:
             await self._client.__aexit__(exc_type, exc_val, exc_tb)
             self._session_active = False
@@ -74,6 +75,7 @@ class AzurePricingServer:
 
         Call this method to close the session when not using context manager.
         """
+        await self._tool_handlers.aclose()
         if self._session_active:
             await self._client.__aexit__(None, None, None)
             self._session_active = False
@@ -8,7 +8,7 @@ import logging
 from typing import Any
 
 from ..auth import AzureCredentialManager, get_credential_manager
-from .orphaned_resources import OrphanedResourceScanner
+from .orphaned_resources import MAX_CONCURRENT_REQUESTS, OrphanedResourceScanner
 
 logger = logging.getLogger(__name__)
 
@@ -19,33 +19,38 @@ class OrphanedResourcesService:
     def __init__(
         self,
         credential_manager: AzureCredentialManager | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize the orphaned resources service.
 
         Args:
             credential_manager: Optional credential manager. If not provided,
                               uses the singleton instance.
+            max_concurrency: Maximum number of Azure API requests the scanner
+                           keeps in flight at once.
         """
         self._credential_manager = credential_manager or get_credential_manager()
-        self._scanner = OrphanedResourceScanner(self._credential_manager)
+        self._scanner = OrphanedResourceScanner(self._credential_manager, max_concurrency=max_concurrency)
 
     async def find_orphaned_resources(
         self,
         days: int = 60,
         all_subscriptions: bool = True,
+        skip_cost: bool = False,
     ) -> dict[str, Any]:
         """Find orphaned resources across Azure subscriptions.
 
         Args:
             days: Number of days to look back for cost data.
             all_subscriptions: If True, scan all accessible subscriptions.
+            skip_cost: If True, skip all Cost Management lookups.
 
         Returns:
             Dict with orphaned resources grouped by subscription, or error dict.
         """
         logger.info(f"Scanning for orphaned resources (lookback: {days} days, all subs: {all_subscriptions})")
 
-        result = await self._scanner.scan(days=days, all_subscriptions=all_subscriptions)
+        result = await self._scanner.scan(days=days, all_subscriptions=all_subscriptions, skip_cost=skip_cost)
 
         if "error" not in result:
             logger.info(
@@ -54,3 +59,7 @@ class OrphanedResourcesService:
             )
 
         return result
+
+    async def aclose(self) -> None:
+        """Close the scanner's shared HTTP session."""
+        await self._scanner.aclose()
@@ -8,19 +8,54 @@ All methods require Azure authentication. If not authenticated, they return
 a friendly error message with instructions for how to authenticate.
 """
 
+import asyncio
 import logging
+import os
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 import aiohttp
 
 from ..auth import AzureCredentialManager, get_credential_manager
+from ..client import json_loads
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Default lookback window for cost queries
 COST_LOOKBACK_DAYS = 60
 
+# Upper bound on concurrent Resource Graph / Cost Management requests per scanner,
+# keeping parallel scans under the ARM throttling limits
+MAX_CONCURRENT_REQUESTS = 8
+
+# Resource IDs per grouped Cost Management query; keeps each grouped result
+# within a single 1000-row response page
+MAX_RESOURCES_PER_COST_QUERY = 500
+
+# Cost Management responses that per-resource queries would hit too: throttling
+# (429/503) and auth failures (401/403). A grouped query failing with one of these
+# must not fan out into per-resource fallback queries.
+COST_NO_FALLBACK_STATUSES = frozenset({401, 403, 429, 503})
+
+# Connection pool size for the scanner's shared HTTP session (all requests go to ARM)
+HTTP_CONNECTION_LIMIT = 32
+HTTP_CONNECTION_LIMIT_PER_HOST = 16
+
+# How long successful Resource Graph query results are reused across scans
+RESULT_CACHE_TTL = timedelta(seconds=60)
+
+# How long a resource's looked-up cost is reused across scans
+COST_CACHE_TTL = timedelta(minutes=15)
+
+# How long the accessible subscription list is reused before re-listing
+SUBSCRIPTION_CACHE_TTL = timedelta(minutes=5)
+
+# Environment variable naming the subscription scanned when all_subscriptions=False
+DEFAULT_SUBSCRIPTION_ENV_VAR = "AZURE_SUBSCRIPTION_ID"
+
 # Azure Cost Management API version
 AZURE_COST_MANAGEMENT_API_VERSION = "2023-11-01"
 
@@ -34,59 +69,117 @@ ARM_API_VERSIONS = {
     "subscriptions": "2022-12-01",
 }
 
-# Resource Graph query for orphaned disks (unattached managed disks)
-ORPHANED_DISKS_QUERY = """
-Resources
-| where type =~ 'microsoft.compute/disks'
-| where managedBy == '' or isnull(managedBy)
-| where not(name endswith '-ASRReplica' or name startswith 'ms-asr-')
-| project id, name, type, location, resourceGroup,
-    subscriptionId, sku = tostring(sku.name),
-    diskSizeGb = tostring(properties.diskSizeGB),
-    timeCreated = tostring(properties.timeCreated)
-"""
+# Labels attached to each orphaned resource row as "orphan_type"
+ORPHAN_TYPE_DISK = "Unattached Disk"
+ORPHAN_TYPE_NIC = "Orphaned NIC"
+ORPHAN_TYPE_PUBLIC_IP = "Orphaned Public IP"
+ORPHAN_TYPE_NSG = "Orphaned NSG"
+ORPHAN_TYPE_APP_SERVICE_PLAN = "Empty App Service Plan"
+
+# Columns projected for every orphan type
+ORPHAN_COMMON_COLUMNS = ("id", "name", "type", "location", "resourceGroup", "subscriptionId")
+
+# Per orphan type: ARM resource type (lower-cased), the Resource Graph filters
+# that make a resource of that type an orphan, and its extra projected columns.
+# The combined query and its row classification are built from this table.
+ORPHAN_TYPE_SPECS: dict[str, tuple[str, tuple[str, ...], dict[str, str]]] = {
+    # Unattached managed disks, excluding Site Recovery replicas
+    ORPHAN_TYPE_DISK: (
+        "microsoft.compute/disks",
+        (
+            "managedBy == '' or isnull(managedBy)",
+            "not(name endswith '-ASRReplica' or name startswith 'ms-asr-')",
+        ),
+        {
+            "sku": "tostring(sku.name)",
+            "diskSizeGb": "tostring(properties.diskSizeGB)",
+            "timeCreated": "tostring(properties.timeCreated)",
+        },
+    ),
+    # NICs not attached to any VM or private endpoint
+    ORPHAN_TYPE_NIC: (
+        "microsoft.network/networkinterfaces",
+        (
+            "isnull(properties.virtualMachine.id) or properties.virtualMachine.id == ''",
+            "isnull(properties.privateEndpoint.id) or properties.privateEndpoint.id == ''",
+        ),
+        {},
+    ),
+    # Public IPs not associated with an IP configuration or NAT gateway
+    ORPHAN_TYPE_PUBLIC_IP: (
+        "microsoft.network/publicipaddresses",
+        (
+            "isnull(properties.ipConfiguration.id) or properties.ipConfiguration.id == ''",
+            "isnull(properties.natGateway.id) or properties.natGateway.id == ''",
+        ),
+        {"allocationMethod": "tostring(properties.publicIPAllocationMethod)"},
+    ),
+    # NSGs not associated with any subnet or NIC
+    ORPHAN_TYPE_NSG: (
+        "microsoft.network/networksecuritygroups",
+        (
+            "isnull(properties.networkInterfaces) or array_length(properties.networkInterfaces) == 0",
+            "isnull(properties.subnets) or array_length(properties.subnets) == 0",
+        ),
+        {},
+    ),
+    # App Service Plans hosting no apps
+    ORPHAN_TYPE_APP_SERVICE_PLAN: (
+        "microsoft.web/serverfarms",
+        ("properties.numberOfSites == 0",),
+        {"sku": "tostring(sku.name)", "tier": "tostring(sku.tier)"},
+    ),
+}
 
-# Resource Graph query for orphaned NICs (not attached to any VM)
-ORPHANED_NICS_QUERY = """
-Resources
-| where type =~ 'microsoft.network/networkinterfaces'
-| where isnull(properties.virtualMachine.id) or properties.virtualMachine.id == ''
-| where isnull(properties.privateEndpoint.id) or properties.privateEndpoint.id == ''
-| project id, name, type, location, resourceGroup,
-    subscriptionId
-"""
 
-# Resource Graph query for orphaned public IPs (not associated)
-ORPHANED_PUBLIC_IPS_QUERY = """
-Resources
-| where type =~ 'microsoft.network/publicipaddresses'
-| where isnull(properties.ipConfiguration.id) or properties.ipConfiguration.id == ''
-| where isnull(properties.natGateway.id) or properties.natGateway.id == ''
-| project id, name, type, location, resourceGroup,
-    subscriptionId,
-    allocationMethod = tostring(properties.publicIPAllocationMethod)
-"""
+def _project_clause(columns: dict[str, str]) -> str:
+    """Build a Resource Graph project clause of the common columns plus extras."""
+    extras = [f"{name} = {expr}" for name, expr in columns.items()]
+    return "| project " + ", ".join([*ORPHAN_COMMON_COLUMNS, *extras])
 
-# Resource Graph query for orphaned NSGs (not associated with subnet or NIC)
-ORPHANED_NSGS_QUERY = """
-Resources
-| where type =~ 'microsoft.network/networksecuritygroups'
-| where isnull(properties.networkInterfaces) or array_length(properties.networkInterfaces) == 0
-| where isnull(properties.subnets) or array_length(properties.subnets) == 0
-| project id, name, type, location, resourceGroup,
-    subscriptionId
-"""
 
-# Resource Graph query for empty App Service Plans
-ORPHANED_ASP_QUERY = """
-Resources
-| where type =~ 'microsoft.web/serverfarms'
-| where properties.numberOfSites == 0
-| project id, name, type, location, resourceGroup,
-    subscriptionId,
-    sku = tostring(sku.name),
-    tier = tostring(sku.tier)
-"""
+def _build_combined_orphan_query() -> str:
+    """Build one Resource Graph query matching every orphan type.
+
+    Each branch of the where clause ANDs one type's filters, and the projection
+    is the union of every type's columns.
+    """
+    branches = []
+    columns: dict[str, str] = {}
+    for resource_type, filters, type_columns in ORPHAN_TYPE_SPECS.values():
+        conditions = [f"type =~ '{resource_type}'", *(f"({condition})" for condition in filters)]
+        branches.append("(" + " and ".join(conditions) + ")")
+        columns.update(type_columns)
+    return "\n".join(["Resources", "| where " + "\n    or ".join(branches), _project_clause(columns)])
+
+
+# Resource Graph scopes a single request to at most 1000 subscriptions
+MAX_SUBSCRIPTIONS_PER_QUERY = 1000
+
+# Rows per Resource Graph page (the API maximum); larger results are paged via $skipToken
+RESOURCE_GRAPH_PAGE_SIZE = 1000
+
+# Single Resource Graph query covering every orphan type
+ORPHANED_COMBINED_QUERY = _build_combined_orphan_query()
+
+# Classifies combined query rows by ARM resource type (lower-cased)
+ORPHAN_TYPE_BY_RESOURCE_TYPE: dict[str, str] = {
+    resource_type: label for label, (resource_type, _, _) in ORPHAN_TYPE_SPECS.items()
+}
+
+# Per orphan type, the combined query's columns that belong only to other types;
+# stripping them leaves each row with just its own type's columns
+COMBINED_QUERY_FOREIGN_COLUMNS: dict[str, frozenset[str]] = {
+    label: frozenset(column for _, _, columns in ORPHAN_TYPE_SPECS.values() for column in columns)
+    - frozenset(own_columns)
+    for label, (_, _, own_columns) in ORPHAN_TYPE_SPECS.items()
+}
+
+
+def _evict_expired(cache: dict[Any, tuple[datetime, Any]], ttl: timedelta, now: datetime) -> None:
+    """Drop cache entries older than ttl so a long-running server doesn't keep them forever."""
+    for key in [key for key, (cached_at, _) in cache.items() if now - cached_at >= ttl]:
+        del cache[key]
 
 
 class OrphanedResourceScanner:
@@ -95,14 +188,85 @@ class OrphanedResourceScanner:
     def __init__(
         self,
         credential_manager: AzureCredentialManager | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize the orphaned resource scanner.
 
         Args:
             credential_manager: Optional credential manager. If not provided,
                               uses the singleton instance.
+            max_concurrency: Maximum number of Azure API requests in flight at once.
         """
         self._credential_manager = credential_manager or get_credential_manager()
+        self._semaphore = asyncio.BoundedSemaphore(max_concurrency)
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._result_cache: dict[Hashable, tuple[datetime, Any]] = {}
+        self._subs_cache: tuple[datetime, list[dict[str, str]]] | None = None
+        self._cost_cache: dict[tuple[str, str, int], tuple[datetime, float]] = {}
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the scanner's shared HTTP session, creating it on first use.
+
+        Reusing one pooled session keeps TLS connections to ARM alive across
+        the many Resource Graph and Cost Management requests in a scan.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _dedupe(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[T]],
+        cacheable: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Coalesce identical concurrent requests and reuse recent results.
+
+        Args:
+            key: Signature identifying the request.
+            fetch: Factory for the coroutine that performs the request.
+            cacheable: Predicate deciding whether a result may be cached for
+                RESULT_CACHE_TTL. If omitted, only in-flight requests are shared.
+
+        Returns:
+            The cached, in-flight, or freshly fetched result.
+        """
+        cached = self._result_cache.get(key)
+        if cached is not None and datetime.now() - cached[0] < RESULT_CACHE_TTL:
+            result: T = cached[1]
+            return result
+
+        task = self._inflight.get(key)
+        if task is None:
+
+            async def run() -> T:
+                value = await fetch()
+                if cacheable is not None and cacheable(value):
+                    now = datetime.now()
+                    _evict_expired(self._result_cache, RESULT_CACHE_TTL, now)
+                    self._result_cache[key] = (now, value)
+                return value
+
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller being cancelled does not cancel the shared request
+        shared: T = await asyncio.shield(task)
+        return shared
 
     def _check_authentication(self) -> dict[str, Any] | None:
         """Check if user is authenticated.
@@ -132,11 +296,64 @@ class OrphanedResourceScanner:
         query: str,
         subscription_ids: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Execute a query against Azure Resource Graph.
+        """Execute a query against Azure Resource Graph, deduplicating identical requests.
+
+        Args:
+            query: KQL query string for Resource Graph.
+            subscription_ids: Optional list of subscription IDs to scope the query.
+
+        Returns:
+            Query results or error dict.
+        """
+        key = ("graph", query, tuple(sorted(subscription_ids or ())))
+        return await self._dedupe(
+            key,
+            lambda: self._fetch_resource_graph_query(query, subscription_ids),
+            lambda result: "error" not in result,
+        )
+
+    async def _fetch_resource_graph_query(
+        self,
+        query: str,
+        subscription_ids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Execute a query against Azure Resource Graph, following $skipToken pages.
+
+        Each page's skip token is only known once that page arrives, so pages
+        are fetched one after another and accumulated into a single result.
+
+        Args:
+            query: KQL query string for Resource Graph.
+            subscription_ids: Optional list of subscription IDs to scope the query.
+
+        Returns:
+            Query results with all pages' rows under "data", or error dict.
+        """
+        rows: list[dict[str, Any]] = []
+        skip_token: str | None = None
+        while True:
+            page = await self._fetch_resource_graph_page(query, subscription_ids, skip_token)
+            if "error" in page:
+                return page
+            rows.extend(page.get("data", []))
+            skip_token = page.get("$skipToken")
+            if not skip_token:
+                break
+
+        return {"data": rows, "count": len(rows), "totalRecords": page.get("totalRecords", len(rows))}
+
+    async def _fetch_resource_graph_page(
+        self,
+        query: str,
+        subscription_ids: list[str] | None = None,
+        skip_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Fetch a single page of Azure Resource Graph query results.
 
         Args:
             query: KQL query string for Resource Graph.
             subscription_ids: Optional list of subscription IDs to scope the query.
+            skip_token: Continuation token returned by the previous page.
 
         Returns:
             Query results or error dict.
@@ -154,17 +371,23 @@ class OrphanedResourceScanner:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
-        body: dict[str, Any] = {"query": query}
+        options: dict[str, Any] = {"$top": RESOURCE_GRAPH_PAGE_SIZE}
+        if skip_token:
+            options["$skipToken"] = skip_token
+        body: dict[str, Any] = {"query": query, "options": options}
         if subscription_ids:
             body["subscriptions"] = subscription_ids
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._semaphore:
+                session = self._get_session()
                 async with session.post(url, headers=headers, json=body) as response:
                     if response.status == 200:
-                        result: dict[str, Any] = await response.json()
+                        result: dict[str, Any] = await response.json(loads=json_loads)
                         return result
                     elif response.status == 401:
+                        # The cached subscription list may belong to the expired credential
+                        self.refresh_subscriptions()
                         return {
                             "error": "unauthorized",
                             "message": "Azure credentials are invalid or expired.",
@@ -190,7 +413,25 @@ class OrphanedResourceScanner:
             }
 
     async def _get_subscriptions(self) -> list[dict[str, str]] | dict[str, Any]:
-        """Get all accessible Azure subscriptions.
+        """Get all accessible Azure subscriptions, reusing a recent listing.
+
+        Returns:
+            List of subscription dicts with 'id' and 'name' keys, or error dict.
+        """
+        if self._subs_cache is not None and datetime.now() - self._subs_cache[0] < SUBSCRIPTION_CACHE_TTL:
+            return self._subs_cache[1]
+
+        result = await self._fetch_subscriptions()
+        if isinstance(result, list):
+            self._subs_cache = (datetime.now(), result)
+        return result
+
+    def refresh_subscriptions(self) -> None:
+        """Invalidate the cached subscription list so the next scan re-lists it."""
+        self._subs_cache = None
+
+    async def _fetch_subscriptions(self) -> list[dict[str, str]] | dict[str, Any]:
+        """List all accessible Azure subscriptions from the ARM API.
 
         Returns:
             List of subscription dicts with 'id' and 'name' keys, or error dict.
@@ -210,10 +451,11 @@ class OrphanedResourceScanner:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._semaphore:
+                session = self._get_session()
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_loads)
                         subs = [
                             {
                                 "id": sub["subscriptionId"],
@@ -236,11 +478,164 @@ class OrphanedResourceScanner:
                 "message": f"Failed to connect to Azure management API: {e}",
             }
 
+    async def _get_default_subscription(self) -> list[dict[str, str]] | dict[str, Any]:
+        """Get the single subscription scanned when all_subscriptions=False.
+
+        If AZURE_SUBSCRIPTION_ID is set, only that subscription is fetched
+        instead of listing the whole tenant; otherwise the first accessible
+        subscription is used.
+
+        Returns:
+            List with at most one subscription dict (empty if the default
+            subscription is not enabled), or error dict.
+        """
+        default_id = os.environ.get(DEFAULT_SUBSCRIPTION_ENV_VAR)
+        if not default_id:
+            subs_result = await self._get_subscriptions()
+            if isinstance(subs_result, dict):
+                return subs_result
+            return subs_result[:1]
+
+        token = self._credential_manager.get_token()
+        if not token:
+            return {
+                "error": "token_acquisition_failed",
+                "message": "Failed to acquire Azure access token.",
+                "help": self._credential_manager.get_authentication_help_message(),
+            }
+
+        url = (
+            f"https://management.azure.com/subscriptions/{default_id}"
+            f"?api-version={ARM_API_VERSIONS['subscriptions']}"
+        )
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+
+        try:
+            async with self._semaphore:
+                session = self._get_session()
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 200:
+                        sub = await response.json(loads=json_loads)
+                        # Skip disabled subscriptions, as the full listing does
+                        if sub.get("state") != "Enabled":
+                            logger.warning(f"Default subscription {default_id} is {sub.get('state')}; skipping it")
+                            return []
+                        return [
+                            {
+                                "id": sub["subscriptionId"],
+                                "name": sub.get("displayName", sub["subscriptionId"]),
+                            }
+                        ]
+                    elif response.status == 401:
+                        # The cached subscription list may belong to the expired credential
+                        self.refresh_subscriptions()
+                        return {
+                            "error": "unauthorized",
+                            "message": "Azure credentials are invalid or expired.",
+                            "help": self._credential_manager.get_authentication_help_message(),
+                        }
+                    elif response.status == 403:
+                        return {
+                            "error": "forbidden",
+                            "message": f"Insufficient permissions to read subscription {default_id}.",
+                            "help": self._credential_manager.get_required_permissions_message(),
+                        }
+                    else:
+                        error_text = await response.text()
+                        return {
+                            "error": "api_error",
+                            "message": f"Failed to get subscription {default_id}: {response.status}",
+                            "details": error_text,
+                        }
+        except aiohttp.ClientError as e:
+            return {
+                "error": "network_error",
+                "message": f"Failed to connect to Azure management API: {e}",
+            }
+
+    @staticmethod
+    def _cost_query_url(subscription_id: str) -> str:
+        """Build the Cost Management query URL for a subscription."""
+        return (
+            f"https://management.azure.com/subscriptions/{subscription_id}"
+            f"/providers/Microsoft.CostManagement/query"
+            f"?api-version={AZURE_COST_MANAGEMENT_API_VERSION}"
+        )
+
+    @staticmethod
+    def _build_cost_query_body(
+        resource_ids: list[str],
+        days: int,
+        group_by_resource: bool = False,
+    ) -> dict[str, Any]:
+        """Build a Cost Management query body summing cost for the given resources.
+
+        Args:
+            resource_ids: Full ARM resource IDs to filter on.
+            days: Number of days to look back.
+            group_by_resource: If True, return one row per resource ID.
+
+        Returns:
+            Request body for the Cost Management query API.
+        """
+        end_date = datetime.now(timezone.utc)
+        start_date = end_date - timedelta(days=days)
+
+        dataset: dict[str, Any] = {
+            "granularity": "None",
+            "aggregation": {
+                "totalCost": {"name": "Cost", "function": "Sum"},
+            },
+            "filter": {
+                "dimensions": {
+                    "name": "ResourceId",
+                    "operator": "In",
+                    "values": resource_ids,
+                },
+            },
+        }
+        if group_by_resource:
+            dataset["grouping"] = [{"type": "Dimension", "name": "ResourceId"}]
+
+        return {
+            "type": "ActualCost",
+            "timeframe": "Custom",
+            "timePeriod": {
+                "from": start_date.strftime("%Y-%m-%dT00:00:00Z"),
+                "to": end_date.strftime("%Y-%m-%dT23:59:59Z"),
+            },
+            "dataset": dataset,
+        }
+
     async def _get_resource_cost(
         self,
         subscription_id: str,
         resource_id: str,
         days: int,
+    ) -> float | None:
+        """Look up accrued cost for a single resource, deduplicating identical requests.
+
+        Args:
+            subscription_id: Azure subscription ID.
+            resource_id: Full ARM resource ID.
+            days: Number of days to look back.
+
+        Returns:
+            Total cost in USD, or None if cost data is unavailable.
+        """
+        return await self._dedupe(
+            ("cost", resource_id.lower(), days),
+            lambda: self._fetch_resource_cost(subscription_id, resource_id, days),
+        )
+
+    async def _fetch_resource_cost(
+        self,
+        subscription_id: str,
+        resource_id: str,
+        days: int,
     ) -> float | None:
         """Look up accrued cost for a single resource via Cost Management API.
 
@@ -256,45 +651,19 @@ class OrphanedResourceScanner:
         if not token:
             return None
 
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=days)
-
-        url = (
-            f"https://management.azure.com/subscriptions/{subscription_id}"
-            f"/providers/Microsoft.CostManagement/query"
-            f"?api-version={AZURE_COST_MANAGEMENT_API_VERSION}"
-        )
+        url = self._cost_query_url(subscription_id)
         headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
-        body = {
-            "type": "ActualCost",
-            "timeframe": "Custom",
-            "timePeriod": {
-                "from": start_date.strftime("%Y-%m-%dT00:00:00Z"),
-                "to": end_date.strftime("%Y-%m-%dT23:59:59Z"),
-            },
-            "dataset": {
-                "granularity": "None",
-                "aggregation": {
-                    "totalCost": {"name": "Cost", "function": "Sum"},
-                },
-                "filter": {
-                    "dimensions": {
-                        "name": "ResourceId",
-                        "operator": "In",
-                        "values": [resource_id],
-                    },
-                },
-            },
-        }
+        body = self._build_cost_query_body([resource_id], days)
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._semaphore:
+                session = self._get_session()
                 async with session.post(url, headers=headers, json=body) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_loads)
                         rows = data.get("properties", {}).get("rows", [])
                         if rows:
                             # First column is the cost value
@@ -307,17 +676,208 @@ class OrphanedResourceScanner:
             logger.debug(f"Cost query error for {resource_id}: {e}")
             return None
 
+    async def _get_resource_costs_bulk(
+        self,
+        subscription_id: str,
+        resource_ids: list[str],
+        days: int,
+    ) -> dict[str, float | None] | None:
+        """Look up accrued costs for many resources, deduplicating identical requests.
+
+        Args:
+            subscription_id: Azure subscription ID.
+            resource_ids: Full ARM resource IDs in the subscription.
+            days: Number of days to look back.
+
+        Returns:
+            Dict mapping lower-cased resource ID to total cost in USD (None if
+            throttled), or None if the query failed.
+        """
+        key = ("costs", subscription_id, tuple(sorted(rid.lower() for rid in resource_ids)), days)
+        return await self._dedupe(key, lambda: self._fetch_resource_costs_bulk(subscription_id, resource_ids, days))
+
+    async def _fetch_resource_costs_bulk(
+        self,
+        subscription_id: str,
+        resource_ids: list[str],
+        days: int,
+    ) -> dict[str, float | None] | None:
+        """Look up accrued costs for many resources with one grouped Cost Management query.
+
+        Args:
+            subscription_id: Azure subscription ID.
+            resource_ids: Full ARM resource IDs in the subscription.
+            days: Number of days to look back.
+
+        Returns:
+            Dict mapping lower-cased resource ID to total cost in USD, or None
+            if the query failed. Resources without cost rows are omitted. If
+            the API is throttling or rejects the credentials, or there is no
+            token, every resource maps to None (cost unavailable) so callers
+            don't retry it resource by resource.
+        """
+        unavailable: dict[str, float | None] = dict.fromkeys((rid.lower() for rid in resource_ids), None)
+        token = self._credential_manager.get_token()
+        if not token:
+            return unavailable
+
+        url = self._cost_query_url(subscription_id)
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+        body = self._build_cost_query_body(resource_ids, days, group_by_resource=True)
+
+        try:
+            async with self._semaphore:
+                session = self._get_session()
+                async with session.post(url, headers=headers, json=body) as response:
+                    if response.status == 200:
+                        data = await response.json(loads=json_loads)
+                        properties = data.get("properties", {})
+                        columns = [c.get("name", "").lower() for c in properties.get("columns", [])]
+                        cost_idx = columns.index("cost") if "cost" in columns else 0
+                        id_idx = columns.index("resourceid") if "resourceid" in columns else 1
+                        costs: dict[str, float | None] = {}
+                        for row in properties.get("rows", []):
+                            rid = str(row[id_idx]).lower()
+                            costs[rid] = (costs.get(rid) or 0.0) + float(row[cost_idx])
+                        return costs
+                    elif response.status in COST_NO_FALLBACK_STATUSES:
+                        logger.debug(f"Bulk cost query unavailable for {subscription_id}: HTTP {response.status}")
+                        return unavailable
+                    else:
+                        logger.debug(f"Bulk cost query failed for {subscription_id}: HTTP {response.status}")
+                        return None
+        except Exception as e:
+            logger.debug(f"Bulk cost query error for {subscription_id}: {e}")
+            return None
+
+    async def _get_subscription_costs(
+        self,
+        subscription_id: str,
+        resource_ids: list[str],
+        days: int,
+    ) -> list[float | None]:
+        """Look up costs for resources in one subscription, in input order.
+
+        Resources costed within COST_CACHE_TTL are served from the cache. The
+        rest use one grouped query per chunk of resource IDs, falling back to
+        per-resource lookups for any chunk whose grouped query fails for a
+        reason other than throttling or an auth error.
+        """
+        now = datetime.now()
+        known: dict[str, float | None] = {}
+        for rid in resource_ids:
+            entry = self._cost_cache.get((subscription_id, rid.lower(), days))
+            if entry is not None and now - entry[0] < COST_CACHE_TTL:
+                known[rid] = entry[1]
+
+        missing = [rid for rid in resource_ids if rid not in known]
+        fetched = await self._fetch_subscription_costs(subscription_id, missing, days) if missing else []
+        if fetched:
+            _evict_expired(self._cost_cache, COST_CACHE_TTL, now)
+        for rid, cost in zip(missing, fetched, strict=True):
+            known[rid] = cost
+            # Only real costs are cached; unavailable data is retried next scan
+            if cost is not None:
+                self._cost_cache[(subscription_id, rid.lower(), days)] = (now, cost)
+
+        return [known[rid] for rid in resource_ids]
+
+    async def _fetch_subscription_costs(
+        self,
+        subscription_id: str,
+        resource_ids: list[str],
+        days: int,
+    ) -> list[float | None]:
+        """Query costs for resources in one subscription, in input order."""
+        chunks = [
+            resource_ids[start : start + MAX_RESOURCES_PER_COST_QUERY]
+            for start in range(0, len(resource_ids), MAX_RESOURCES_PER_COST_QUERY)
+        ]
+        chunk_costs = await asyncio.gather(
+            *(self._get_resource_costs_bulk(subscription_id, chunk, days) for chunk in chunks)
+        )
+
+        results: list[float | None] = []
+        for chunk, costs in zip(chunks, chunk_costs, strict=True):
+            if costs is None:
+                results.extend(
+                    await asyncio.gather(*(self._get_resource_cost(subscription_id, rid, days) for rid in chunk))
+                )
+            else:
+                results.extend(costs.get(rid.lower(), 0.0) for rid in chunk)
+        return results
+
+    async def _query_orphaned_resources(self, subscription_ids: list[str]) -> dict[str, Any]:
+        """Run the combined orphaned resource query and tag each row with its orphan type.
+
+        Args:
+            subscription_ids: Subscription IDs to scope the query to.
+
+        Returns:
+            Dict with ``data`` (orphaned resource rows, each with an ``orphan_type``
+            label) and ``errors`` (error dicts for the subscription chunks whose
+            query failed), or the first error dict if every chunk failed.
+        """
+        # One request covers every subscription, chunked to the API's limit
+        sub_chunks = [
+            subscription_ids[start : start + MAX_SUBSCRIPTIONS_PER_QUERY]
+            for start in range(0, len(subscription_ids), MAX_SUBSCRIPTIONS_PER_QUERY)
+        ]
+
+        # The chunks are independent, so query them concurrently
+        results = await asyncio.gather(
+            *(self._execute_resource_graph_query(ORPHANED_COMBINED_QUERY, chunk) for chunk in sub_chunks),
+            return_exceptions=True,
+        )
+
+        all_orphaned: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to query for orphaned resources: {result}")
+                errors.append({"error": "query_failed", "message": f"Resource Graph query failed: {result}"})
+                continue
+            if "error" in result:
+                logger.warning(f"Failed to query for orphaned resources: {result.get('message')}")
+                errors.append(result)
+                continue
+
+            for resource in result.get("data", []):
+                orphan_type = ORPHAN_TYPE_BY_RESOURCE_TYPE.get(str(resource.get("type", "")).lower())
+                if orphan_type is None:
+                    logger.warning(f"Skipping unrecognized resource type: {resource.get('type')}")
+                    continue
+                # The combined projection also carries other types' (empty) columns; drop those.
+                # Building a new dict also keeps cached query results from being mutated.
+                foreign_columns = COMBINED_QUERY_FOREIGN_COLUMNS[orphan_type]
+                row = {k: v for k, v in resource.items() if k not in foreign_columns}
+                row["orphan_type"] = orphan_type
+                all_orphaned.append(row)
+
+        # Every query failed: report the failure rather than a clean scan
+        if errors and len(errors) == len(sub_chunks):
+            return errors[0]
+        return {"data": all_orphaned, "errors": errors}
+
     async def scan(
         self,
         days: int = COST_LOOKBACK_DAYS,
         all_subscriptions: bool = True,
+        skip_cost: bool = False,
     ) -> dict[str, Any]:
         """Scan for orphaned resources and compute their costs.
 
         Args:
             days: Number of days to look back for cost data.
             all_subscriptions: If True, scan all accessible subscriptions.
-                             If False, scan only the first subscription.
+                             If False, scan only the subscription named by the
+                             AZURE_SUBSCRIPTION_ID environment variable, or the
+                             first accessible one if it is unset.
+            skip_cost: If True, return the inventory only and make no
+                     Cost Management calls. Also implied by days <= 0.
 
         Returns:
             Dict containing orphaned resources grouped by subscription,
@@ -328,8 +888,11 @@ class OrphanedResourceScanner:
         if auth_error:
             return auth_error
 
-        # Get subscriptions
-        subs_result = await self._get_subscriptions()
+        # Get subscriptions, fetching only the default one when not scanning all
+        if all_subscriptions:
+            subs_result = await self._get_subscriptions()
+        else:
+            subs_result = await self._get_default_subscription()
         if isinstance(subs_result, dict) and "error" in subs_result:
             return subs_result
 
@@ -343,43 +906,34 @@ class OrphanedResourceScanner:
                 "message": "No accessible Azure subscriptions found.",
             }
 
-        if not all_subscriptions:
-            subscriptions = [subscriptions[0]]
-
         subscription_ids = [s["id"] for s in subscriptions]
 
-        # Execute all orphaned resource queries
-        queries = {
-            "Unattached Disk": ORPHANED_DISKS_QUERY,
-            "Orphaned NIC": ORPHANED_NICS_QUERY,
-            "Orphaned Public IP": ORPHANED_PUBLIC_IPS_QUERY,
-            "Orphaned NSG": ORPHANED_NSGS_QUERY,
-            "Empty App Service Plan": ORPHANED_ASP_QUERY,
-        }
-
-        all_orphaned: list[dict[str, Any]] = []
+        query_result = await self._query_orphaned_resources(subscription_ids)
+        if "error" in query_result:
+            return query_result
+        all_orphaned: list[dict[str, Any]] = query_result["data"]
 
-        for resource_type_label, query in queries.items():
-            result = await self._execute_resource_graph_query(query, subscription_ids)
-            if "error" in result:
-                logger.warning(f"Failed to query for {resource_type_label}: {result.get('message')}")
-                continue
-
-            resources = result.get("data", [])
-            for resource in resources:
-                resource["orphan_type"] = resource_type_label
-                all_orphaned.append(resource)
-
-        # Look up costs for each orphaned resource
-        total_cost = 0.0
+        # Look up costs with one grouped query per subscription, concurrently
+        skip_cost = skip_cost or days <= 0
+        costed_by_sub: dict[str, list[dict[str, Any]]] = {}
         for resource in all_orphaned:
-            sub_id = resource.get("subscriptionId", "")
-            resource_id = resource.get("id", "")
-            if sub_id and resource_id:
-                cost = await self._get_resource_cost(sub_id, resource_id, days)
+            if skip_cost:
+                resource["estimated_cost_usd"] = None
+            elif resource.get("subscriptionId") and resource.get("id"):
+                costed_by_sub.setdefault(resource["subscriptionId"], []).append(resource)
+
+        sub_costs = await asyncio.gather(
+            *(
+                self._get_subscription_costs(sub_id, [r["id"] for r in resources], days)
+                for sub_id, resources in costed_by_sub.items()
+            )
+        )
+
+        # Rows are already private copies, so attach costs in place
+        for resources, costs in zip(costed_by_sub.values(), sub_costs, strict=True):
+            for resource, cost in zip(resources, costs, strict=True):
                 resource["estimated_cost_usd"] = cost
-                if cost is not None:
-                    total_cost += cost
+        total_cost = sum((cost for costs in sub_costs for cost in costs if cost is not None), 0.0)
 
         # Group results by subscription
         sub_name_map = {s["id"]: s["name"] for s in subscriptions}
@@ -396,14 +950,21 @@ class OrphanedResourceScanner:
 
         subscription_results = list(by_subscription.values())
 
-        return {
+        result: dict[str, Any] = {
             "subscriptions": subscription_results,
             "total_orphaned": len(all_orphaned),
+            "subscriptions_scanned": len(subscriptions),
             "total_estimated_cost": round(total_cost, 2),
             "lookback_days": days,
             "currency": "USD",
+            "cost_skipped": skip_cost,
             "note": (
                 f"Scanned {len(subscriptions)} subscription(s) for orphaned resources. "
-                f"Cost data covers the last {days} days."
+                + ("Cost lookup was skipped." if skip_cost else f"Cost data covers the last {days} days.")
             ),
         }
+        # Some subscription chunks could not be queried, so orphans may be missing
+        if query_result["errors"]:
+            result["partial"] = True
+            result["errors"] = [e.get("message", e["error"]) for e in query_result["errors"]]
+        return result
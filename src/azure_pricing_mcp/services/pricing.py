@@ -1,10 +1,11 @@
 """Pricing service for Azure Pricing MCP Server."""
 
+import asyncio
 import logging
 from typing import Any
 
 from ..client import AzurePricingClient
-from ..config import DEFAULT_CUSTOMER_DISCOUNT
+from ..config import DEFAULT_CUSTOMER_DISCOUNT, MAX_CONCURRENT_PRICE_REQUESTS
 from .retirement import RetirementService
 
 logger = logging.getLogger(__name__)
@@ -52,6 +53,7 @@ class PricingService:
     def __init__(self, client: AzurePricingClient, retirement_service: RetirementService) -> None:
         self._client = client
         self._retirement_service = retirement_service
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PRICE_REQUESTS)
 
     async def search_prices(
         self,
@@ -228,30 +230,11 @@ class PricingService:
         comparisons = []
 
         if regions and isinstance(regions, list):
-            for region in regions:
-                try:
-                    result = await self.search_prices(
-                        service_name=service_name,
-                        sku_name=sku_name,
-                        region=region,
-                        currency_code=currency_code,
-                        limit=10,
-                    )
-
-                    if result["items"]:
-                        item = result["items"][0]
-                        comparisons.append(
-                            {
-                                "region": region,
-                                "sku_name": item.get("skuName"),
-                                "retail_price": item.get("retailPrice"),
-                                "unit_of_measure": item.get("unitOfMeasure"),
-                                "product_name": item.get("productName"),
-                                "meter_name": item.get("meterName"),
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to get prices for region {region}: {e}")
+            # Query all regions concurrently, bounded so large region lists don't flood the API
+            region_prices = await asyncio.gather(
+                *(self._get_region_price(service_name, sku_name, region, currency_code) for region in regions)
+            )
+            comparisons = [price for price in region_prices if price is not None]
         else:
             result = await self.search_prices(
                 service_name=service_name,
@@ -300,6 +283,36 @@ class PricingService:
 
         return result_data
 
+    async def _get_region_price(
+        self, service_name: str, sku_name: str | None, region: str, currency_code: str
+    ) -> dict[str, Any] | None:
+        """Get the first matching price in a region, or None if there is none."""
+        try:
+            async with self._request_semaphore:
+                result = await self.search_prices(
+                    service_name=service_name,
+                    sku_name=sku_name,
+                    region=region,
+                    currency_code=currency_code,
+                    limit=10,
+                )
+        except Exception as e:
+            logger.warning(f"Failed to get prices for region {region}: {e}")
+            return None
+
+        if not result["items"]:
+            return None
+
+        item = result["items"][0]
+        return {
+            "region": region,
+            "sku_name": item.get("skuName"),
+            "retail_price": item.get("retailPrice"),
+            "unit_of_measure": item.get("unitOfMeasure"),
+            "product_name": item.get("productName"),
+            "meter_name": item.get("meterName"),
+        }
+
     async def recommend_regions(
         self,
         service_name: str,
@@ -548,19 +561,30 @@ class PricingService:
         limit: int = 50,
     ) -> dict[str, Any]:
         """Get Reserved Instance pricing and optionally compare with On-Demand."""
-        ri_filter = ["priceType eq 'Reservation'"]
+        common_filter = []
         if service_name:
-            ri_filter.append(f"serviceName eq '{service_name}'")
+            common_filter.append(f"serviceName eq '{service_name}'")
         if region:
-            ri_filter.append(f"armRegionName eq '{region}'")
+            common_filter.append(f"armRegionName eq '{region}'")
         if sku_name:
-            ri_filter.append(f"contains(skuName, '{sku_name}')")
+            common_filter.append(f"contains(skuName, '{sku_name}')")
 
-        ri_data = await self._client.fetch_prices(
-            filter_conditions=ri_filter,
+        ri_request = self._client.fetch_prices(
+            filter_conditions=["priceType eq 'Reservation'", *common_filter],
             currency_code=currency_code,
             limit=limit,
         )
+        od_data: dict[str, Any] | None = None
+        if compare_on_demand:
+            # Fetch on-demand prices alongside the RI prices rather than after them
+            od_request = self._client.fetch_prices(
+                filter_conditions=["priceType eq 'Consumption'", *common_filter],
+                currency_code=currency_code,
+                limit=limit * 2,
+            )
+            ri_data, od_data = await asyncio.gather(ri_request, od_request)
+        else:
+            ri_data = await ri_request
         ri_items = ri_data.get("Items", [])
 
         if reservation_term:
@@ -572,20 +596,7 @@ class PricingService:
             "count": len(ri_items),
         }
 
-        if compare_on_demand and ri_items:
-            od_filter = ["priceType eq 'Consumption'"]
-            if service_name:
-                od_filter.append(f"serviceName eq '{service_name}'")
-            if region:
-                od_filter.append(f"armRegionName eq '{region}'")
-            if sku_name:
-                od_filter.append(f"contains(skuName, '{sku_name}')")
-
-            od_data = await self._client.fetch_prices(
-                filter_conditions=od_filter,
-                currency_code=currency_code,
-                limit=limit * 2,
-            )
+        if od_data is not None and ri_items:
             od_items = od_data.get("Items", [])
 
             comparison = self._calculate_ri_savings(ri_items, od_items)
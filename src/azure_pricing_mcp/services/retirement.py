@@ -155,20 +155,35 @@ class RetirementService:
         self._client = client
         self._cache: dict[str, VMSeriesRetirementInfo] | None = None
         self._cache_time: datetime | None = None
+        # Serializes refreshes so concurrent lookups on a cold cache download the files once
+        self._refresh_lock = asyncio.Lock()
+
+    def _cached_data(self) -> dict[str, VMSeriesRetirementInfo] | None:
+        """Return the cached retirement data if it is still fresh."""
+        if self._cache is not None and self._cache_time is not None:
+            if (datetime.now() - self._cache_time) < RETIREMENT_CACHE_TTL:
+                return self._cache
+        return None
 
     async def get_retirement_data(self) -> dict[str, VMSeriesRetirementInfo]:
         """Get retirement data, using cache if valid or fetching fresh data."""
-        now = datetime.now()
-
         # Check if cache is valid
-        if self._cache is not None and self._cache_time is not None and (now - self._cache_time) < RETIREMENT_CACHE_TTL:
+        cached = self._cached_data()
+        if cached is not None:
+            return cached
+
+        async with self._refresh_lock:
+            # Another caller may have refreshed the cache while we waited
+            cached = self._cached_data()
+            if cached is not None:
+                return cached
+
+            # Fetch fresh data
+            now = datetime.now()
+            self._cache = await self._fetch_retirement_data()
+            self._cache_time = now
             return self._cache
 
-        # Fetch fresh data
-        self._cache = await self._fetch_retirement_data()
-        self._cache_time = now
-        return self._cache
-
     async def _fetch_retirement_data(self) -> dict[str, VMSeriesRetirementInfo]:
         """Fetch VM retirement status data from Microsoft docs on GitHub."""
         if not self._client.session:
@@ -16,6 +16,7 @@ from typing import Any
 import aiohttp
 
 from ..auth import AzureCredentialManager, get_credential_manager
+from ..client import json_loads
 from ..config import (
     AZURE_COMPUTE_API_VERSION,
     AZURE_RESOURCE_GRAPH_API_VERSION,
@@ -43,6 +44,19 @@ class SpotService:
         self._eviction_cache_time: datetime | None = None
         self._price_cache: dict[str, Any] | None = None
         self._price_cache_time: datetime | None = None
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the service's shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def _check_authentication(self) -> dict[str, Any] | None:
         """Check if user is authenticated.
@@ -99,30 +113,30 @@ class SpotService:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        result: dict[str, Any] = await response.json()
-                        return result
-                    elif response.status == 401:
-                        return {
-                            "error": "unauthorized",
-                            "message": "Azure credentials are invalid or expired.",
-                            "help": self._credential_manager.get_authentication_help_message(),
-                        }
-                    elif response.status == 403:
-                        return {
-                            "error": "forbidden",
-                            "message": "Insufficient permissions for Resource Graph query.",
-                            "help": self._credential_manager.get_required_permissions_message(),
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "error": "api_error",
-                            "message": f"Resource Graph API error: {response.status}",
-                            "details": error_text,
-                        }
+            session = self._get_session()
+            async with session.post(url, headers=headers, json=body) as response:
+                if response.status == 200:
+                    result: dict[str, Any] = await response.json(loads=json_loads)
+                    return result
+                elif response.status == 401:
+                    return {
+                        "error": "unauthorized",
+                        "message": "Azure credentials are invalid or expired.",
+                        "help": self._credential_manager.get_authentication_help_message(),
+                    }
+                elif response.status == 403:
+                    return {
+                        "error": "forbidden",
+                        "message": "Insufficient permissions for Resource Graph query.",
+                        "help": self._credential_manager.get_required_permissions_message(),
+                    }
+                else:
+                    error_text = await response.text()
+                    return {
+                        "error": "api_error",
+                        "message": f"Resource Graph API error: {response.status}",
+                        "details": error_text,
+                    }
         except aiohttp.ClientError as e:
             return {
                 "error": "network_error",
@@ -295,45 +309,45 @@ SpotResources
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers) as response:
-                    if response.status == 204:
-                        return {
-                            "status": "success",
-                            "message": "Eviction simulation triggered successfully.",
-                            "vm_resource_id": vm_resource_id,
-                            "note": "The VM will receive a 30-second eviction notice via Scheduled Events.",
-                        }
-                    elif response.status == 401:
-                        return {
-                            "error": "unauthorized",
-                            "message": "Azure credentials are invalid or expired.",
-                            "help": self._credential_manager.get_authentication_help_message(),
-                        }
-                    elif response.status == 403:
-                        return {
-                            "error": "forbidden",
-                            "message": "Insufficient permissions to simulate eviction.",
-                            "help": self._credential_manager.get_required_permissions_message("simulate_eviction"),
-                        }
-                    elif response.status == 404:
-                        return {
-                            "error": "not_found",
-                            "message": "VM not found or is not a Spot VM.",
-                            "vm_resource_id": vm_resource_id,
-                        }
-                    else:
-                        error_text = await response.text()
-                        try:
-                            error_json = json.loads(error_text)
-                            error_message = error_json.get("error", {}).get("message", error_text)
-                        except json.JSONDecodeError:
-                            error_message = error_text
-                        return {
-                            "error": "api_error",
-                            "message": f"Compute API error: {response.status}",
-                            "details": error_message,
-                        }
+            session = self._get_session()
+            async with session.post(url, headers=headers) as response:
+                if response.status == 204:
+                    return {
+                        "status": "success",
+                        "message": "Eviction simulation triggered successfully.",
+                        "vm_resource_id": vm_resource_id,
+                        "note": "The VM will receive a 30-second eviction notice via Scheduled Events.",
+                    }
+                elif response.status == 401:
+                    return {
+                        "error": "unauthorized",
+                        "message": "Azure credentials are invalid or expired.",
+                        "help": self._credential_manager.get_authentication_help_message(),
+                    }
+                elif response.status == 403:
+                    return {
+                        "error": "forbidden",
+                        "message": "Insufficient permissions to simulate eviction.",
+                        "help": self._credential_manager.get_required_permissions_message("simulate_eviction"),
+                    }
+                elif response.status == 404:
+                    return {
+                        "error": "not_found",
+                        "message": "VM not found or is not a Spot VM.",
+                        "vm_resource_id": vm_resource_id,
+                    }
+                else:
+                    error_text = await response.text()
+                    try:
+                        error_json = json.loads(error_text)
+                        error_message = error_json.get("error", {}).get("message", error_text)
+                    except json.JSONDecodeError:
+                        error_message = error_text
+                    return {
+                        "error": "api_error",
+                        "message": f"Compute API error: {response.status}",
+                        "details": error_message,
+                    }
         except aiohttp.ClientError as e:
             return {
                 "error": "network_error",
@@ -1,10 +1,17 @@
 """Tool definitions for Azure Pricing MCP Server."""
 
+import functools
+
 from mcp.types import Tool
 
 
+@functools.cache
 def get_tool_definitions() -> list[Tool]:
-    """Get all tool definitions for the Azure Pricing MCP Server."""
+    """Get all tool definitions for the Azure Pricing MCP Server.
+
+    The definitions are static, so the list is built once per process and
+    shared by every caller; treat it as read-only.
+    """
     return [
         Tool(
             name="azure_price_search",
@@ -358,9 +365,20 @@ def get_tool_definitions() -> list[Tool]:
                     },
                     "all_subscriptions": {
                         "type": "boolean",
-                        "description": "Scan all accessible subscriptions (default: true). Set to false to scan only the first subscription.",
+                        "description": "Scan all accessible subscriptions (default: true). Set to false to scan a single subscription: the one named by the AZURE_SUBSCRIPTION_ID environment variable if set, otherwise the first accessible one.",
                         "default": True,
                     },
+                    "skip_cost": {
+                        "type": "boolean",
+                        "description": "List orphaned resources without looking up their cost (default: false). Faster, and needs no Cost Management access.",
+                        "default": False,
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": "Response format: 'markdown' for a report or 'json' for the raw scan result (default: markdown)",
+                        "enum": ["markdown", "json"],
+                        "default": "markdown",
+                    },
                 },
             },
         ),
@@ -0,0 +1,110 @@
+"""Shared pytest fixtures for Azure Pricing MCP Server tests."""
+
+import copy
+import os
+from typing import Any
+
+import pytest
+import pytest_asyncio
+
+from azure_pricing_mcp.client import AzurePricingClient
+from azure_pricing_mcp.config import MAX_RETRIES
+from azure_pricing_mcp.handlers import ToolHandlers
+from azure_pricing_mcp.services import PricingService, SKUService
+from azure_pricing_mcp.services.retirement import RetirementService
+
+# uvloop schedules the many small mocked coroutines faster; it has no Windows build
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on the environment
+    uvloop = None
+
+# Set AZURE_PRICING_CACHE=1 to replay identical Retail Prices API calls from memory
+RESPONSE_CACHE_ENABLED = os.environ.get("AZURE_PRICING_CACHE", "0") == "1"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --run-integration command-line flag."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="Run tests marked as integration (these call the live Azure APIs)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip integration tests unless --run-integration was given."""
+    if config.getoption("--run-integration"):
+        return
+
+    skip_integration = pytest.mark.skip(reason="needs --run-integration to call live Azure APIs")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config: pytest.Config, item: pytest.Item) -> dict[str, Any]:
+        """Run async tests on uvloop when it is installed (pytest-asyncio >= 1.4)."""
+        return {"uvloop": uvloop.new_event_loop}
+
+    if not hasattr(pytest_asyncio.plugin, "PytestAsyncioSpecs"):
+        # Older pytest-asyncio releases select the loop through this fixture instead
+        @pytest.fixture(scope="session")
+        def event_loop_policy():
+            """Run async tests on uvloop when it is installed."""
+            return uvloop.EventLoopPolicy()
+
+
+class CachingTestClient(AzurePricingClient):
+    """AzurePricingClient that memoizes API responses for the test session.
+
+    Integration tests repeatedly query the same services, regions and SKUs.
+    Caching by (url, params) collapses those repeats to a single live call
+    and keeps the suite clear of the API's rate limiter.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._response_cache: dict[tuple[str | None, frozenset[tuple[str, Any]]], dict[str, Any]] = {}
+
+    async def make_request(
+        self, url: str | None = None, params: dict[str, Any] | None = None, max_retries: int = MAX_RETRIES
+    ) -> dict[str, Any]:
+        key = (url, frozenset((params or {}).items()))
+        if key not in self._response_cache:
+            self._response_cache[key] = await super().make_request(url=url, params=params, max_retries=max_retries)
+        # Services decorate the returned items in place, so hand out copies
+        return copy.deepcopy(self._response_cache[key])
+
+
+@pytest_asyncio.fixture(scope="session")
+async def services():
+    """Create all services once per test session.
+
+    The services are stateless wrappers around a single AzurePricingClient,
+    so sharing them lets every test reuse the same HTTP connection pool.
+    """
+    client_cls = CachingTestClient if RESPONSE_CACHE_ENABLED else AzurePricingClient
+    async with client_cls() as client:
+        retirement_service = RetirementService(client)
+        pricing_service = PricingService(client, retirement_service)
+        sku_service = SKUService(pricing_service)
+        tool_handlers = ToolHandlers(pricing_service, sku_service)
+        yield {
+            "client": client,
+            "pricing": pricing_service,
+            "sku": sku_service,
+            "retirement": retirement_service,
+            "handlers": tool_handlers,
+        }
+
+
+@pytest_asyncio.fixture(scope="session")
+async def sample_vm_sku(services):
+    """Discover one real VM SKU once per session for tests that need any valid SKU."""
+    result = await services["pricing"].search_prices(service_name="Virtual Machines", region="eastus", limit=1)
+    return result["items"][0]["skuName"] if result["items"] else None
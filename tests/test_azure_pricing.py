@@ -1,5 +1,6 @@
 """Comprehensive tests for Azure Pricing MCP Server."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -7,6 +8,7 @@ import pytest
 from mcp.types import TextContent
 
 from azure_pricing_mcp.client import AzurePricingClient
+from azure_pricing_mcp.config import MAX_CONCURRENT_PRICE_REQUESTS
 from azure_pricing_mcp.handlers import ToolHandlers
 from azure_pricing_mcp.services import PricingService, SKUService
 from azure_pricing_mcp.services.retirement import RetirementService
@@ -218,6 +220,28 @@ class TestPricingService:
             assert len(result["comparisons"]) == 2
             assert mock_search.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_compare_prices_bounds_concurrent_region_lookups(self, pricing_service, mock_pricing_response):
+        """Region lookups run concurrently but never exceed the request cap."""
+        in_flight = peak = 0
+
+        async def fake_search(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"items": [mock_pricing_response["Items"][0]], "count": 1}
+
+        regions = [f"region{i}" for i in range(MAX_CONCURRENT_PRICE_REQUESTS + 4)]
+        with patch.object(pricing_service, "search_prices", side_effect=fake_search):
+            result = await pricing_service.compare_prices(
+                service_name="Virtual Machines", sku_name="D4s v3", regions=regions
+            )
+
+        assert len(result["comparisons"]) == len(regions)
+        assert 1 < peak <= MAX_CONCURRENT_PRICE_REQUESTS
+
     @pytest.mark.asyncio
     async def test_estimate_costs(self, pricing_service, mock_pricing_response_with_savings):
         """Test cost estimation with savings plans."""
@@ -295,6 +319,27 @@ class TestPricingService:
         assert discounted[1]["originalPrice"] == 200.0
 
 
+class TestRetirementService:
+    """Test suite for RetirementService class."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_cache_lookups_fetch_once(self, retirement_service):
+        """Concurrent lookups on a cold cache share a single download."""
+        fetch_count = 0
+
+        async def fake_fetch():
+            nonlocal fetch_count
+            fetch_count += 1
+            await asyncio.sleep(0)
+            return {}
+
+        with patch.object(retirement_service, "_fetch_retirement_data", side_effect=fake_fetch):
+            results = await asyncio.gather(*(retirement_service.get_retirement_data() for _ in range(5)))
+
+        assert fetch_count == 1
+        assert all(result is results[0] for result in results)
+
+
 class TestSKUService:
     """Test suite for SKUService class."""
 
@@ -11,22 +11,6 @@ from starlette.routing import Mount, Route
 
 from azure_pricing_mcp.client import AzurePricingClient
 from azure_pricing_mcp.server import create_server
-from azure_pricing_mcp.services import PricingService, SKUService
-from azure_pricing_mcp.services.retirement import RetirementService
-
-
-@pytest.fixture
-async def services():
-    """Create all services for testing."""
-    async with AzurePricingClient() as client:
-        retirement_service = RetirementService(client)
-        pricing_service = PricingService(client, retirement_service)
-        sku_service = SKUService(pricing_service)
-        yield {
-            "pricing": pricing_service,
-            "sku": sku_service,
-            "retirement": retirement_service,
-        }
 
 
 class TestHTTPTransportConfiguration:
@@ -108,21 +92,12 @@ class TestHTTPTransportTools:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_cost_estimate_tool_via_handler(self, services):
+    async def test_cost_estimate_tool_via_handler(self, services, sample_vm_sku):
         """Test azure_cost_estimate tool through handler."""
-        # First find a valid SKU
-        search_result = await services["pricing"].search_prices(
-            service_name="Virtual Machines", region="eastus", limit=1
-        )
-
-        if search_result["items"]:
-            item = search_result["items"][0]
-            sku_name = item.get("skuName")
-
-            # Now estimate costs
+        if sample_vm_sku:
             result = await services["pricing"].estimate_costs(
                 service_name="Virtual Machines",
-                sku_name=sku_name,
+                sku_name=sample_vm_sku,
                 region="eastus",
                 hours_per_month=730,
             )
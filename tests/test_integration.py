@@ -1,29 +1,11 @@
 """Integration tests for Azure Pricing MCP Server.
 
 These tests make actual API calls to Azure's pricing API.
-Run with: pytest tests/test_integration.py -v
+Run with: pytest tests/test_integration.py -v --run-integration
 """
 
 import pytest
 
-from azure_pricing_mcp.client import AzurePricingClient
-from azure_pricing_mcp.services import PricingService, SKUService
-from azure_pricing_mcp.services.retirement import RetirementService
-
-
-@pytest.fixture
-async def services():
-    """Create all services for integration testing."""
-    async with AzurePricingClient() as client:
-        retirement_service = RetirementService(client)
-        pricing_service = PricingService(client, retirement_service)
-        sku_service = SKUService(pricing_service)
-        yield {
-            "pricing": pricing_service,
-            "sku": sku_service,
-            "retirement": retirement_service,
-        }
-
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Test the MCP server by simulating stdin/stdout communication."""
 
+import asyncio
+import logging
+from collections.abc import Awaitable
 from unittest.mock import AsyncMock
 
 import pytest
+from mcp.types import TextContent
 
-from azure_pricing_mcp.client import AzurePricingClient
 from azure_pricing_mcp.config import DEFAULT_CUSTOMER_DISCOUNT
 from azure_pricing_mcp.formatters import (
     DISCOUNT_TIP_DEFAULT_USED,
@@ -15,22 +18,8 @@ from azure_pricing_mcp.formatters import (
 from azure_pricing_mcp.handlers import ToolHandlers
 from azure_pricing_mcp.server import AzurePricingServer, create_server
 from azure_pricing_mcp.services import PricingService, SKUService
-from azure_pricing_mcp.services.retirement import RetirementService
 
-
-@pytest.fixture
-async def services():
-    """Create all services for testing."""
-    async with AzurePricingClient() as client:
-        retirement_service = RetirementService(client)
-        pricing_service = PricingService(client, retirement_service)
-        sku_service = SKUService(pricing_service)
-        tool_handlers = ToolHandlers(pricing_service, sku_service)
-        yield {
-            "pricing": pricing_service,
-            "sku": sku_service,
-            "handlers": tool_handlers,
-        }
+logger = logging.getLogger(__name__)
 
 
 @pytest.mark.integration
@@ -47,12 +36,9 @@ async def test_mcp_server(services):
         },
     )
 
-    print("Tool call result:")
     for item in result:
-        print(f"Type: {type(item)}")
         if hasattr(item, "text"):
-            print(f"Text length: {len(item.text)}")
-            print(f"Text preview: {item.text[:200]}...")
+            logger.debug("Text length=%d preview=%s", len(item.text), item.text[:200])
 
     assert len(result) > 0
     assert hasattr(result[0], "text")
@@ -110,50 +96,57 @@ async def test_pricing_server_context_manager():
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_all_tool_handlers(services):
+async def test_all_tool_handlers(services, sample_vm_sku):
     """Test all tool handlers work."""
-    # Test price search
-    result = await services["handlers"].handle_price_search({"service_name": "Virtual Machines", "limit": 5})
-    assert len(result) > 0
-
-    # Test price compare
-    result = await services["handlers"].handle_price_compare(
-        {"service_name": "Virtual Machines", "regions": ["eastus", "westus"]}
+    handlers = services["handlers"]
+    # Cap concurrency so the live API's rate limiter is not triggered
+    limiter = asyncio.Semaphore(4)
+
+    async def bounded(call: Awaitable[list[TextContent]]) -> list[TextContent]:
+        async with limiter:
+            return await call
+
+    # The independent handler calls run concurrently
+    results = await asyncio.gather(
+        *(
+            bounded(call)
+            for call in (
+                handlers.handle_price_search({"service_name": "Virtual Machines", "limit": 5}),
+                handlers.handle_price_compare({"service_name": "Virtual Machines", "regions": ["eastus", "westus"]}),
+                handlers.handle_discover_skus({"service_name": "Virtual Machines", "limit": 10}),
+                handlers.handle_sku_discovery({"service_hint": "vm"}),
+                handlers.handle_customer_discount({}),
+            )
+        )
     )
-    assert len(result) > 0
+    assert all(len(result) > 0 for result in results)
 
-    # Test cost estimate
-    search = await services["pricing"].search_prices(service_name="Virtual Machines", region="eastus", limit=1)
-    if search["items"]:
-        sku = search["items"][0]["skuName"]
-        result = await services["handlers"].handle_cost_estimate(
-            {"service_name": "Virtual Machines", "sku_name": sku, "region": "eastus"}
+    # Test cost estimate (depends on a SKU discovered by a search)
+    if sample_vm_sku:
+        result = await handlers.handle_cost_estimate(
+            {"service_name": "Virtual Machines", "sku_name": sample_vm_sku, "region": "eastus"}
         )
         assert len(result) > 0
 
-    # Test discover SKUs
-    result = await services["handlers"].handle_discover_skus({"service_name": "Virtual Machines", "limit": 10})
-    assert len(result) > 0
 
-    # Test SKU discovery
-    result = await services["handlers"].handle_sku_discovery({"service_hint": "vm"})
-    assert len(result) > 0
+@pytest.fixture(scope="module")
+def service_mocks():
+    """Build the spec'd service mocks once; introspecting the spec classes is the costly part."""
+    return AsyncMock(spec=PricingService), AsyncMock(spec=SKUService)
 
-    # Test customer discount
-    result = await services["handlers"].handle_customer_discount({})
-    assert len(result) > 0
+
+@pytest.fixture
+def tool_handlers(service_mocks):
+    """Create a ToolHandlers instance with freshly reset mock services."""
+    for mock in service_mocks:
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_pricing, mock_sku = service_mocks
+    return ToolHandlers(mock_pricing, mock_sku)
 
 
 class TestResolveDiscount:
     """Tests for the _resolve_discount helper method."""
 
-    @pytest.fixture
-    def tool_handlers(self):
-        """Create a ToolHandlers instance with mock services."""
-        mock_pricing = AsyncMock(spec=PricingService)
-        mock_sku = AsyncMock(spec=SKUService)
-        return ToolHandlers(mock_pricing, mock_sku)
-
     def test_show_with_discount_true_no_discount_percentage(self, tool_handlers):
         """Test that show_with_discount=True without discount_percentage uses default discount."""
         arguments = {"show_with_discount": True, "service_name": "Virtual Machines"}
@@ -306,34 +299,79 @@ class TestDiscountMetadataPropagation:
 class TestHandlerDiscountIntegration:
     """Integration tests for discount handling in tool handlers."""
 
-    @pytest.fixture
-    def tool_handlers(self):
-        """Create a ToolHandlers instance with mock services."""
-        mock_pricing = AsyncMock(spec=PricingService)
-        mock_sku = AsyncMock(spec=SKUService)
-        return ToolHandlers(mock_pricing, mock_sku)
-
+    @pytest.mark.parametrize(
+        "handler_name, service_method, arguments, return_value",
+        [
+            (
+                "handle_price_search",
+                "search_prices",
+                {"service_name": "Virtual Machines"},
+                {
+                    "items": [],
+                    "count": 0,
+                    "has_more": False,
+                    "currency": "USD",
+                    "filters_applied": [],
+                },
+            ),
+            (
+                "handle_price_compare",
+                "compare_prices",
+                {"service_name": "Virtual Machines", "regions": ["eastus", "westus"]},
+                {
+                    "service_name": "Virtual Machines",
+                    "comparison_type": "region",
+                    "comparisons": [],
+                    "currency": "USD",
+                },
+            ),
+            (
+                "handle_cost_estimate",
+                "estimate_costs",
+                {"service_name": "Virtual Machines", "sku_name": "Standard_D2s_v3", "region": "eastus"},
+                {
+                    "service_name": "Virtual Machines",
+                    "sku_name": "Standard_D2s_v3",
+                    "region": "eastus",
+                    "product_name": "Virtual Machines D Series",
+                    "unit_of_measure": "1 Hour",
+                    "currency": "USD",
+                    "usage_assumptions": {
+                        "hours_per_month": 730,
+                        "hours_per_day": 24,
+                    },
+                    "on_demand_pricing": {
+                        "hourly_rate": 0.096,
+                        "daily_cost": 2.304,
+                        "monthly_cost": 70.08,
+                        "yearly_cost": 840.96,
+                    },
+                    "savings_plans": [],
+                },
+            ),
+            (
+                "handle_region_recommend",
+                "recommend_regions",
+                {"service_name": "Virtual Machines", "sku_name": "Standard_D2s_v3"},
+                {
+                    "recommendations": [],
+                    "currency": "USD",
+                },
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_handle_price_search_with_show_with_discount(self, tool_handlers):
-        """Test handle_price_search with show_with_discount=True applies default discount."""
-        # Mock the service response
-        tool_handlers._pricing_service.search_prices.return_value = {
-            "items": [],
-            "count": 0,
-            "has_more": False,
-            "currency": "USD",
-            "filters_applied": [],
-        }
+    async def test_handler_with_show_with_discount(
+        self, tool_handlers, handler_name, service_method, arguments, return_value
+    ):
+        """Test that show_with_discount=True makes each handler apply the default discount."""
+        service_mock = getattr(tool_handlers._pricing_service, service_method)
+        service_mock.return_value = return_value
 
-        await tool_handlers.handle_price_search(
-            {
-                "service_name": "Virtual Machines",
-                "show_with_discount": True,
-            }
-        )
+        await getattr(tool_handlers, handler_name)({**arguments, "show_with_discount": True})
 
         # Verify the service was called with the default discount
-        call_kwargs = tool_handlers._pricing_service.search_prices.call_args.kwargs
+        call_kwargs = service_mock.call_args.kwargs
         assert call_kwargs["discount_percentage"] == DEFAULT_CUSTOMER_DISCOUNT
 
     @pytest.mark.asyncio
@@ -407,78 +445,3 @@ class TestHandlerDiscountIntegration:
         # The formatted response should contain the default discount tip
         assert len(result) == 1
         assert DISCOUNT_TIP_DEFAULT_USED in result[0].text
-
-    @pytest.mark.asyncio
-    async def test_handle_price_compare_with_show_with_discount(self, tool_handlers):
-        """Test handle_price_compare with show_with_discount=True applies default discount."""
-        tool_handlers._pricing_service.compare_prices.return_value = {
-            "service_name": "Virtual Machines",
-            "comparison_type": "region",
-            "comparisons": [],
-            "currency": "USD",
-        }
-
-        await tool_handlers.handle_price_compare(
-            {
-                "service_name": "Virtual Machines",
-                "regions": ["eastus", "westus"],
-                "show_with_discount": True,
-            }
-        )
-
-        call_kwargs = tool_handlers._pricing_service.compare_prices.call_args.kwargs
-        assert call_kwargs["discount_percentage"] == DEFAULT_CUSTOMER_DISCOUNT
-
-    @pytest.mark.asyncio
-    async def test_handle_cost_estimate_with_show_with_discount(self, tool_handlers):
-        """Test handle_cost_estimate with show_with_discount=True applies default discount."""
-        tool_handlers._pricing_service.estimate_costs.return_value = {
-            "service_name": "Virtual Machines",
-            "sku_name": "Standard_D2s_v3",
-            "region": "eastus",
-            "product_name": "Virtual Machines D Series",
-            "unit_of_measure": "1 Hour",
-            "currency": "USD",
-            "usage_assumptions": {
-                "hours_per_month": 730,
-                "hours_per_day": 24,
-            },
-            "on_demand_pricing": {
-                "hourly_rate": 0.096,
-                "daily_cost": 2.304,
-                "monthly_cost": 70.08,
-                "yearly_cost": 840.96,
-            },
-            "savings_plans": [],
-        }
-
-        await tool_handlers.handle_cost_estimate(
-            {
-                "service_name": "Virtual Machines",
-                "sku_name": "Standard_D2s_v3",
-                "region": "eastus",
-                "show_with_discount": True,
-            }
-        )
-
-        call_kwargs = tool_handlers._pricing_service.estimate_costs.call_args.kwargs
-        assert call_kwargs["discount_percentage"] == DEFAULT_CUSTOMER_DISCOUNT
-
-    @pytest.mark.asyncio
-    async def test_handle_region_recommend_with_show_with_discount(self, tool_handlers):
-        """Test handle_region_recommend with show_with_discount=True applies default discount."""
-        tool_handlers._pricing_service.recommend_regions.return_value = {
-            "recommendations": [],
-            "currency": "USD",
-        }
-
-        await tool_handlers.handle_region_recommend(
-            {
-                "service_name": "Virtual Machines",
-                "sku_name": "Standard_D2s_v3",
-                "show_with_discount": True,
-            }
-        )
-
-        call_kwargs = tool_handlers._pricing_service.recommend_regions.call_args.kwargs
-        assert call_kwargs["discount_percentage"] == DEFAULT_CUSTOMER_DISCOUNT
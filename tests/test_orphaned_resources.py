@@ -8,6 +8,10 @@ Tests cover:
 - Handler wiring
 """
 
+import asyncio
+import json
+from dataclasses import dataclass
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -16,7 +20,14 @@ from azure_pricing_mcp.formatters import format_orphaned_resources_response
 from azure_pricing_mcp.handlers import ToolHandlers
 from azure_pricing_mcp.services.orphaned import OrphanedResourcesService
 from azure_pricing_mcp.services.orphaned_resources import (
+    COST_CACHE_TTL,
     COST_LOOKBACK_DAYS,
+    MAX_RESOURCES_PER_COST_QUERY,
+    MAX_SUBSCRIPTIONS_PER_QUERY,
+    ORPHAN_TYPE_BY_RESOURCE_TYPE,
+    ORPHAN_TYPE_SPECS,
+    ORPHANED_COMBINED_QUERY,
+    RESULT_CACHE_TTL,
     OrphanedResourceScanner,
 )
 from azure_pricing_mcp.tools import get_tool_definitions
@@ -26,30 +37,48 @@ from azure_pricing_mcp.tools import get_tool_definitions
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@dataclass(slots=True)
+class FakeCredentialManager:
+    """Plain stand-in for AzureCredentialManager; much cheaper per call than MagicMock."""
+
+    authenticated: bool = True
+    init_error: str | None = None
+    token: str | None = "fake-token"
+
+    def get_initialization_error(self):
+        return self.init_error
+
+    def is_authenticated(self):
+        return self.authenticated
+
+    def get_token(self):
+        return self.token
+
+    def get_authentication_help_message(self):
+        return "Run: az login"
+
+    def get_required_permissions_message(self):
+        return "Reader role required"
+
+
+@pytest.fixture(scope="session")
 def mock_credential_manager():
-    """Create a mock credential manager that appears authenticated."""
-    mgr = MagicMock()
-    mgr.get_initialization_error.return_value = None
-    mgr.is_authenticated.return_value = True
-    mgr.get_token.return_value = "fake-token"
-    mgr.get_authentication_help_message.return_value = "Run: az login"
-    mgr.get_required_permissions_message.return_value = "Reader role required"
-    return mgr
+    """Create one credential manager that appears authenticated, shared by all tests."""
+    return FakeCredentialManager()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def unauthenticated_credential_manager():
-    """Create a mock credential manager that is NOT authenticated."""
-    mgr = MagicMock()
-    mgr.get_initialization_error.return_value = None
-    mgr.is_authenticated.return_value = False
-    mgr.get_authentication_help_message.return_value = "Run: az login"
-    return mgr
+    """Create one credential manager that is NOT authenticated, shared by all tests."""
+    return FakeCredentialManager(authenticated=False, token=None)
 
 
 @pytest.fixture
 def scanner(mock_credential_manager):
+    """Scanner with the default settings.
+
+    Function-scoped: tests patch its methods, and it holds result and subscription caches.
+    """
     return OrphanedResourceScanner(credential_manager=mock_credential_manager)
 
 
@@ -63,17 +92,27 @@ def service(mock_credential_manager):
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def tool_defs():
+    """All tool definitions, shared by the tool definition tests."""
+    return get_tool_definitions()
+
+
+@pytest.fixture(scope="session")
+def tools_by_name(tool_defs):
+    """All tool definitions keyed by name."""
+    return {tool.name: tool for tool in tool_defs}
+
+
 class TestToolDefinition:
-    def test_find_orphaned_resources_tool_exists(self):
-        """The find_orphaned_resources tool must be registered."""
-        tools = get_tool_definitions()
-        names = [t.name for t in tools]
-        assert "find_orphaned_resources" in names
+    def test_find_orphaned_resources_tool_exists(self, tool_defs, tools_by_name):
+        """The find_orphaned_resources tool must be registered under a unique name."""
+        assert "find_orphaned_resources" in tools_by_name
+        assert len(tools_by_name) == len(tool_defs)
 
-    def test_find_orphaned_resources_schema(self):
+    def test_find_orphaned_resources_schema(self, tools_by_name):
         """Schema must declare days (int) and all_subscriptions (bool)."""
-        tools = get_tool_definitions()
-        tool = next(t for t in tools if t.name == "find_orphaned_resources")
+        tool = tools_by_name["find_orphaned_resources"]
         props = tool.inputSchema["properties"]
         assert "days" in props
         assert props["days"]["type"] == "integer"
@@ -87,7 +126,6 @@ class TestToolDefinition:
 
 
 class TestScannerAuth:
-    @pytest.mark.asyncio
     async def test_scan_returns_auth_error_when_not_authenticated(self, unauthenticated_credential_manager):
         """Scanner.scan() should return an error dict when unauthenticated."""
         scanner = OrphanedResourceScanner(credential_manager=unauthenticated_credential_manager)
@@ -95,12 +133,9 @@ class TestScannerAuth:
         assert result["error"] == "authentication_required"
         assert "help" in result
 
-    @pytest.mark.asyncio
     async def test_scan_returns_auth_error_on_init_failure(self):
         """Scanner.scan() should surface initialization errors."""
-        mgr = MagicMock()
-        mgr.get_initialization_error.return_value = "azure-identity not installed"
-        mgr.get_authentication_help_message.return_value = "Install it"
+        mgr = FakeCredentialManager(authenticated=False, init_error="azure-identity not installed", token=None)
         scanner = OrphanedResourceScanner(credential_manager=mgr)
         result = await scanner.scan()
         assert result["error"] == "authentication_required"
@@ -111,23 +146,33 @@ class TestScannerAuth:
 # ---------------------------------------------------------------------------
 
 
+def _counting_stub(return_value):
+    """Async stub that only counts awaits, skipping AsyncMock's call recording."""
+
+    async def stub(*args, **kwargs):
+        stub.count += 1
+        return return_value
+
+    stub.count = 0
+    return stub
+
+
 class TestScannerSubscriptions:
-    @pytest.mark.asyncio
     async def test_scan_handles_empty_subscriptions(self, scanner):
         """Scanner must not crash on an empty subscription list."""
-        scanner._get_subscriptions = AsyncMock(return_value=[])
+        scanner._get_subscriptions = _counting_stub([])
         result = await scanner.scan()
         assert result["total_orphaned"] == 0
         assert "No accessible" in result.get("message", "")
 
-    @pytest.mark.asyncio
-    async def test_scan_all_subscriptions_false_uses_first_only(self, scanner):
+    async def test_scan_all_subscriptions_false_uses_first_only(self, scanner, monkeypatch):
         """all_subscriptions=False should scope to the first subscription."""
+        monkeypatch.delenv("AZURE_SUBSCRIPTION_ID", raising=False)
         subs = [
             {"id": "sub-1", "name": "First"},
             {"id": "sub-2", "name": "Second"},
         ]
-        scanner._get_subscriptions = AsyncMock(return_value=subs)
+        scanner._get_subscriptions = _counting_stub(subs)
         scanner._execute_resource_graph_query = AsyncMock(return_value={"data": []})
 
         await scanner.scan(all_subscriptions=False)
@@ -137,10 +182,122 @@ class TestScannerSubscriptions:
             sub_ids = call[1].get("subscription_ids") or call[0][1]
             assert sub_ids == ["sub-1"]
 
-    @pytest.mark.asyncio
+    async def test_scan_all_subscriptions_false_skips_listing_with_default_env(self, scanner, monkeypatch, fake_http):
+        """A configured default subscription is used without listing the tenant."""
+        monkeypatch.setenv("AZURE_SUBSCRIPTION_ID", "sub-2")
+        scanner._fetch_subscriptions = AsyncMock()
+        scanner._execute_resource_graph_query = AsyncMock(return_value={"data": []})
+        fake_http({"subscriptionId": "sub-2", "displayName": "Second", "state": "Enabled"})
+
+        result = await scanner.scan(all_subscriptions=False)
+
+        scanner._fetch_subscriptions.assert_not_awaited()
+        for call in scanner._execute_resource_graph_query.call_args_list:
+            assert call.args[1] == ["sub-2"]
+        assert "Scanned 1 subscription(s)" in result["note"]
+
+    async def test_disabled_default_subscription_is_not_scanned(self, scanner, monkeypatch, fake_http):
+        monkeypatch.setenv("AZURE_SUBSCRIPTION_ID", "sub-2")
+        scanner._execute_resource_graph_query = AsyncMock()
+        fake_http({"subscriptionId": "sub-2", "displayName": "Second", "state": "Disabled"})
+
+        result = await scanner.scan(all_subscriptions=False)
+
+        scanner._execute_resource_graph_query.assert_not_awaited()
+        assert "No accessible" in result["message"]
+
+    @pytest.mark.parametrize("status,error", [(401, "unauthorized"), (403, "forbidden")])
+    async def test_default_subscription_auth_errors(self, scanner, monkeypatch, fake_http, status, error):
+        monkeypatch.setenv("AZURE_SUBSCRIPTION_ID", "sub-2")
+        scanner._subs_cache = (datetime.now(), [{"id": "sub-1", "name": "Test"}])
+        fake_http(status=status)
+
+        result = await scanner.scan(all_subscriptions=False)
+
+        assert result["error"] == error
+        # Only an expired credential invalidates the cached subscription list
+        assert (scanner._subs_cache is None) == (status == 401)
+
+    async def test_scan_overlaps_per_subscription_cost_lookups(self, scanner):
+        """With several subscriptions, their cost lookups run concurrently."""
+        subs = [{"id": f"sub-{i}", "name": f"Sub {i}"} for i in range(4)]
+        scanner._get_subscriptions = _counting_stub(subs)
+        scanner._execute_resource_graph_query = AsyncMock(return_value={"data": [_disk("disk", s["id"]) for s in subs]})
+        tracker = {"active": 0, "peak": 0}
+
+        async def tracked_costs(subscription_id, resource_ids, days):
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+            await asyncio.sleep(0.01)
+            tracker["active"] -= 1
+            return {rid.lower(): 1.0 for rid in resource_ids}
+
+        scanner._get_resource_costs_bulk = tracked_costs
+
+        result = await scanner.scan()
+
+        assert tracker["peak"] == len(subs)
+        assert len(result["subscriptions"]) == len(subs)
+        assert result["total_estimated_cost"] == 4.0
+
+    async def test_scan_batches_subscriptions_per_query(self, scanner):
+        """All subscriptions go in one request, chunked at the API's 1000-subscription limit."""
+        subs = [{"id": f"sub-{i}", "name": f"Sub {i}"} for i in range(MAX_SUBSCRIPTIONS_PER_QUERY + 1)]
+        scanner._get_subscriptions = _counting_stub(subs)
+        scanner._get_resource_costs_bulk = _counting_stub({})
+        scanner._execute_resource_graph_query = AsyncMock(
+            return_value={"data": [_disk("a", "sub-0"), _disk("b", "sub-1000")]}
+        )
+
+        result = await scanner.scan()
+
+        calls = scanner._execute_resource_graph_query.call_args_list
+        assert sorted(len(call.args[1]) for call in calls) == [1, MAX_SUBSCRIPTIONS_PER_QUERY]
+        # Each chunk's mocked response returns both rows
+        buckets = {s["subscription_id"]: len(s["orphaned_resources"]) for s in result["subscriptions"]}
+        assert buckets == {"sub-0": 2, "sub-1000": 2}
+
+    async def test_subscription_list_is_cached_until_refreshed(self, scanner):
+        scanner._fetch_subscriptions = _counting_stub(return_value=[{"id": "sub-1", "name": "Test"}])
+
+        await scanner._get_subscriptions()
+        await scanner._get_subscriptions()
+        assert scanner._fetch_subscriptions.count == 1
+
+        scanner.refresh_subscriptions()
+        await scanner._get_subscriptions()
+        assert scanner._fetch_subscriptions.count == 2
+
+    async def test_back_to_back_scans_list_subscriptions_once(self, scanner):
+        scanner._fetch_subscriptions = _counting_stub(return_value=[{"id": "sub-1", "name": "Test"}])
+        scanner._execute_resource_graph_query = _counting_stub({"data": []})
+
+        await scanner.scan()
+        await scanner.scan()
+
+        assert scanner._fetch_subscriptions.count == 1
+
+    async def test_unauthorized_graph_response_invalidates_subscription_cache(self, scanner, fake_http):
+        scanner._fetch_subscriptions = _counting_stub(return_value=[{"id": "sub-1", "name": "Test"}])
+        await scanner._get_subscriptions()
+
+        fake_http(status=401)
+        result = await scanner._execute_resource_graph_query("Resources")
+        await scanner._get_subscriptions()
+
+        assert result["error"] == "unauthorized"
+        assert scanner._fetch_subscriptions.count == 2
+
+    async def test_subscription_errors_are_not_cached(self, scanner):
+        scanner._fetch_subscriptions = _counting_stub(return_value={"error": "api_error", "message": "boom"})
+
+        await scanner._get_subscriptions()
+        await scanner._get_subscriptions()
+        assert scanner._fetch_subscriptions.count == 2
+
     async def test_scan_subscription_api_error_propagates(self, scanner):
         """If subscription listing fails, error dict is returned directly."""
-        scanner._get_subscriptions = AsyncMock(return_value={"error": "api_error", "message": "forbidden"})
+        scanner._get_subscriptions = _counting_stub({"error": "api_error", "message": "forbidden"})
         result = await scanner.scan()
         assert result["error"] == "api_error"
 
@@ -151,26 +308,105 @@ class TestScannerSubscriptions:
 
 
 class TestScannerResourceGraph:
-    @pytest.mark.asyncio
-    async def test_partial_graph_failure_does_not_abort(self, scanner):
-        """If one resource type query fails, others still proceed."""
-        subs = [{"id": "sub-1", "name": "Test"}]
-        scanner._get_subscriptions = AsyncMock(return_value=subs)
-        scanner._get_resource_cost = AsyncMock(return_value=0.0)
-
-        call_count = 0
-
-        async def mixed_results(query, subscription_ids=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return {"error": "api_error", "message": "bad query"}
+    async def test_graph_failure_is_returned_not_reported_clean(self, scanner):
+        """If the combined query fails, the scan returns the error rather than zero orphans."""
+        scanner._get_subscriptions = _counting_stub([{"id": "sub-1", "name": "Test"}])
+        scanner._execute_resource_graph_query = _counting_stub({"error": "api_error", "message": "bad query"})
+
+        result = await scanner.scan()
+
+        assert result["error"] == "api_error"
+        assert "No Orphaned Resources" not in format_orphaned_resources_response(result)
+
+    async def test_graph_exception_is_returned_as_error(self, scanner):
+        scanner._get_subscriptions = _counting_stub([{"id": "sub-1", "name": "Test"}])
+        scanner._execute_resource_graph_query = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await scanner.scan()
+
+        assert result["error"] == "query_failed"
+        assert "boom" in result["message"]
+
+    async def test_partial_graph_failure_is_flagged(self, scanner):
+        """If one subscription chunk fails, the others are still reported and the result is marked partial."""
+        subs = [{"id": f"sub-{i}", "name": f"Sub {i}"} for i in range(MAX_SUBSCRIPTIONS_PER_QUERY + 1)]
+        scanner._get_subscriptions = _counting_stub(subs)
+        scanner._get_resource_costs_bulk = _counting_stub({})
+        scanner._execute_resource_graph_query = AsyncMock(
+            side_effect=[{"error": "api_error", "message": "bad query"}, {"data": [_disk("disk1", "sub-1000")]}]
+        )
+
+        result = await scanner.scan(skip_cost=True)
+
+        assert result["total_orphaned"] == 1
+        assert result["partial"] is True
+        assert result["errors"] == ["bad query"]
+        output = format_orphaned_resources_response(result)
+        assert "Incomplete scan" in output
+        assert "bad query" in output
+
+    async def test_partial_failure_with_no_orphans_is_not_reported_clean(self, scanner):
+        subs = [{"id": f"sub-{i}", "name": f"Sub {i}"} for i in range(MAX_SUBSCRIPTIONS_PER_QUERY + 1)]
+        scanner._get_subscriptions = _counting_stub(subs)
+        scanner._execute_resource_graph_query = AsyncMock(side_effect=[RuntimeError("boom"), {"data": []}])
+
+        result = await scanner.scan()
+        output = format_orphaned_resources_response(result)
+
+        assert result["partial"] is True
+        assert "No Orphaned Resources" not in output
+        assert "Incomplete" in output
+
+    async def test_graph_query_follows_skip_token_pages(self, scanner):
+        scanner._fetch_resource_graph_page = AsyncMock(
+            side_effect=[
+                {"data": [{"id": "a"}], "$skipToken": "page-2", "totalRecords": 2},
+                {"data": [{"id": "b"}], "totalRecords": 2},
+            ]
+        )
+
+        result = await scanner._execute_resource_graph_query("Resources", ["sub-1"])
+
+        assert [row["id"] for row in result["data"]] == ["a", "b"]
+        assert result["totalRecords"] == 2
+        assert scanner._fetch_resource_graph_page.call_args_list[1].args == ("Resources", ["sub-1"], "page-2")
+
+    async def test_graph_page_error_is_returned(self, scanner):
+        scanner._fetch_resource_graph_page = AsyncMock(
+            side_effect=[
+                {"data": [{"id": "a"}], "$skipToken": "page-2"},
+                {"error": "api_error", "message": "Resource Graph API error: 500"},
+            ]
+        )
+
+        result = await scanner._execute_resource_graph_query("Resources")
+
+        assert result["error"] == "api_error"
+
+
+class TestScannerResourceTypes:
+    @pytest.mark.parametrize(
+        "match,expected",
+        [
+            ("microsoft.compute/disks", "Unattached Disk"),
+            ("microsoft.network/networkinterfaces", "Orphaned NIC"),
+            ("microsoft.network/publicipaddresses", "Orphaned Public IP"),
+            ("microsoft.network/networksecuritygroups", "Orphaned NSG"),
+            ("microsoft.web/serverfarms", "Empty App Service Plan"),
+        ],
+    )
+    async def test_results_tagged(self, scanner, match, expected):
+        """Combined-query rows are tagged with their resource type's label."""
+        scanner._get_subscriptions = _counting_stub([{"id": "sub-1", "name": "Test"}])
+        scanner._get_resource_costs_bulk = _counting_stub({})
+
+        async def route_query(query, subscription_ids=None):
             return {
                 "data": [
                     {
-                        "id": f"/subs/sub-1/rg/rg1/providers/x/{call_count}",
-                        "name": f"res-{call_count}",
-                        "type": "test",
+                        "id": "/subs/sub-1/rg/rg1/providers/x/res1",
+                        "name": "res1",
+                        "type": match,
                         "location": "eastus",
                         "resourceGroup": "rg1",
                         "subscriptionId": "sub-1",
@@ -178,74 +414,370 @@ class TestScannerResourceGraph:
                 ]
             }
 
-        scanner._execute_resource_graph_query = mixed_results
+        scanner._execute_resource_graph_query = route_query
         result = await scanner.scan()
-        # 5 queries total, first fails, other 4 each return 1 resource
-        assert result["total_orphaned"] == 4
 
+        resources = result["subscriptions"][0]["orphaned_resources"]
+        assert [r["orphan_type"] for r in resources] == [expected]
 
-# ---------------------------------------------------------------------------
-# Scanner – cost lookup
-# ---------------------------------------------------------------------------
 
+class TestScannerCombinedQuery:
+    def test_combined_query_classifies_every_orphan_type(self):
+        assert sorted(ORPHAN_TYPE_BY_RESOURCE_TYPE.values()) == sorted(ORPHAN_TYPE_SPECS)
+        for resource_type in ORPHAN_TYPE_BY_RESOURCE_TYPE:
+            assert f"type =~ '{resource_type}'" in ORPHANED_COMBINED_QUERY
 
-class TestScannerCostLookup:
-    @pytest.mark.asyncio
-    async def test_cost_is_summed_correctly(self, scanner):
-        subs = [{"id": "sub-1", "name": "Test"}]
-        scanner._get_subscriptions = AsyncMock(return_value=subs)
+    @pytest.mark.parametrize("label", list(ORPHAN_TYPE_SPECS))
+    def test_combined_query_includes_type_filters_and_columns(self, label):
+        _, filters, columns = ORPHAN_TYPE_SPECS[label]
+        for condition in filters:
+            assert f"({condition})" in ORPHANED_COMBINED_QUERY
+        for name, expr in columns.items():
+            assert f"{name} = {expr}" in ORPHANED_COMBINED_QUERY
+
+    async def test_combined_rows_classified_by_resource_type(self, mock_credential_manager):
+        scanner = OrphanedResourceScanner(credential_manager=mock_credential_manager)
+        scanner._get_subscriptions = _counting_stub([{"id": "sub-1", "name": "Test"}])
+        scanner._get_resource_costs_bulk = _counting_stub({})
         scanner._execute_resource_graph_query = AsyncMock(
             return_value={
                 "data": [
                     {
-                        "id": "/subs/sub-1/rg/rg1/providers/x/disk1",
-                        "name": "disk1",
-                        "type": "microsoft.compute/disks",
-                        "location": "eastus",
-                        "resourceGroup": "rg1",
+                        "id": "/subs/sub-1/rg/rg1/providers/x/nic1",
+                        "name": "nic1",
+                        "type": "Microsoft.Network/networkInterfaces",
                         "subscriptionId": "sub-1",
+                        "diskSizeGb": "",
                     },
                     {
-                        "id": "/subs/sub-1/rg/rg1/providers/x/disk2",
-                        "name": "disk2",
+                        "id": "/subs/sub-1/rg/rg1/providers/x/disk1",
+                        "name": "disk1",
                         "type": "microsoft.compute/disks",
-                        "location": "eastus",
-                        "resourceGroup": "rg1",
                         "subscriptionId": "sub-1",
+                        "diskSizeGb": "128",
+                        "timeCreated": "",
+                        "allocationMethod": "",
                     },
+                    {"id": "/subs/sub-1/rg/rg1/providers/x/vm1", "name": "vm1", "type": "microsoft.compute/vms"},
                 ]
             }
         )
-        scanner._get_resource_cost = AsyncMock(return_value=12.50)
 
-        result = await scanner.scan(days=30)
-        # 5 queries × 2 resources each × $12.50 = $125.00
-        assert result["total_estimated_cost"] == 125.00
+        result = await scanner.scan()
+
+        scanner._execute_resource_graph_query.assert_awaited_once_with(ORPHANED_COMBINED_QUERY, ["sub-1"])
+        nic, disk = result["subscriptions"][0]["orphaned_resources"]
+        assert nic["orphan_type"] == "Orphaned NIC"
+        assert "diskSizeGb" not in nic
+        assert disk["orphan_type"] == "Unattached Disk"
+        assert disk["diskSizeGb"] == "128"
+        # Only other types' columns are dropped; the disk's own empty values are kept
+        assert disk["timeCreated"] == ""
+        assert "allocationMethod" not in disk
+        assert result["total_orphaned"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Scanner – request concurrency
+# ---------------------------------------------------------------------------
+
+
+class _FakeResponse:
+    """Minimal aiohttp response stand-in that tracks in-flight requests."""
+
+    def __init__(self, tracker, payload, status=200):
+        self.status = status
+        self._tracker = tracker
+        self._payload = payload
+
+    async def __aenter__(self):
+        self._tracker["calls"] += 1
+        self._tracker["active"] += 1
+        self._tracker["peak"] = max(self._tracker["peak"], self._tracker["active"])
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._tracker["active"] -= 1
+
+    async def json(self, **kwargs):
+        return self._payload
+
+
+class _FakeSession:
+    """Minimal aiohttp.ClientSession stand-in returning a canned JSON payload."""
+
+    closed = False
+
+    def __init__(self, tracker, payload=None, status=200):
+        self._tracker = tracker
+        self._payload = payload if payload is not None else {"data": []}
+        self._status = status
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def post(self, url, **kwargs):
+        return _FakeResponse(self._tracker, self._payload, self._status)
+
+    def get(self, url, **kwargs):
+        return _FakeResponse(self._tracker, self._payload, self._status)
+
+
+@pytest.fixture
+def fake_http(monkeypatch):
+    """Factory routing the scanner's aiohttp sessions to _FakeSession.
+
+    Call it with the canned payload and status; it returns a tracker of
+    request counts and in-flight peaks, whose "sessions" entry lists every
+    session created.
+    """
+
+    def install(payload=None, status=200):
+        tracker = {"active": 0, "peak": 0, "calls": 0, "sessions": []}
+
+        def make_session(*args, **kwargs):
+            tracker["sessions"].append(_FakeSession(tracker, payload, status))
+            return tracker["sessions"][-1]
+
+        monkeypatch.setattr("azure_pricing_mcp.services.orphaned_resources.aiohttp.ClientSession", make_session)
+        return tracker
+
+    return install
+
+
+class TestScannerConcurrency:
+    async def test_max_concurrency_bounds_in_flight_requests(self, mock_credential_manager, fake_http):
+        """The service's max_concurrency must cap concurrent Azure API requests."""
+        tracker = fake_http()
+        service = OrphanedResourcesService(credential_manager=mock_credential_manager, max_concurrency=2)
+
+        await asyncio.gather(
+            *(service._scanner._execute_resource_graph_query(f"Resources | take {i}") for i in range(6))
+        )
+
+        assert tracker["peak"] == 2
+
+    async def test_requests_share_one_session_until_closed(self, mock_credential_manager, fake_http):
+        sessions = fake_http()["sessions"]
+        service = OrphanedResourcesService(credential_manager=mock_credential_manager)
+
+        await service._scanner._execute_resource_graph_query("Resources | take 1")
+        await service._scanner._execute_resource_graph_query("Resources | take 2")
+        assert len(sessions) == 1
+
+        await service.aclose()
+        assert sessions[0].closed
+
+    async def test_identical_concurrent_queries_share_one_request(self, mock_credential_manager, fake_http):
+        """Identical in-flight queries are coalesced and the result reused within the TTL."""
+        tracker = fake_http()
+        scanner = OrphanedResourceScanner(credential_manager=mock_credential_manager)
+
+        results = await asyncio.gather(*(scanner._execute_resource_graph_query("Resources") for _ in range(5)))
+        await scanner._execute_resource_graph_query("Resources")
+
+        assert tracker["calls"] == 1
+        assert all(result == results[0] for result in results)
+
+    async def test_expired_results_are_evicted_on_insert(self, mock_credential_manager, fake_http):
+        fake_http()
+        scanner = OrphanedResourceScanner(credential_manager=mock_credential_manager)
+        scanner._result_cache["stale"] = (datetime.now() - RESULT_CACHE_TTL, {"data": []})
+
+        await scanner._execute_resource_graph_query("Resources")
+
+        assert list(scanner._result_cache) == [("graph", "Resources", ())]
+
+
+# ---------------------------------------------------------------------------
+# Scanner – cost lookup
+# ---------------------------------------------------------------------------
+
+
+def _disk(name, subscription_id="sub-1"):
+    """Build a Resource Graph row for an unattached disk."""
+    return {
+        "id": f"/subs/{subscription_id}/rg/rg1/providers/x/{name}",
+        "name": name,
+        "type": "microsoft.compute/disks",
+        "location": "eastus",
+        "resourceGroup": "rg1",
+        "subscriptionId": subscription_id,
+    }
+
+
+@pytest.fixture
+def graph_scanner(request, scanner):
+    """Scanner over one subscription with canned graph rows and cost lookups.
+
+    Parametrize indirectly with (rows, bulk_costs, per_resource_cost); the
+    combined Resource Graph query returns ``rows``.
+    """
+    rows, bulk_costs, per_resource_cost = request.param
+    scanner._get_subscriptions = AsyncMock(return_value=[{"id": "sub-1", "name": "Test"}])
+    scanner._execute_resource_graph_query = AsyncMock(return_value={"data": rows})
+    scanner._get_resource_costs_bulk = AsyncMock(return_value=bulk_costs)
+    scanner._get_resource_cost = AsyncMock(return_value=per_resource_cost)
+    return scanner
+
+
+class TestScannerCostLookup:
+    @pytest.mark.parametrize(
+        "graph_scanner,expected_total,expected_fallback_calls",
+        [
+            # 2 resources × $12.50 = $25.00, from one grouped query
+            pytest.param(
+                (
+                    [_disk("disk1"), _disk("disk2")],
+                    {"/subs/sub-1/rg/rg1/providers/x/disk1": 12.50, "/subs/sub-1/rg/rg1/providers/x/disk2": 12.50},
+                    None,
+                ),
+                25.00,
+                0,
+                id="grouped-costs-summed",
+            ),
+            # Cost data unavailable everywhere: the total must not blow up
+            pytest.param(([_disk("disk1")], None, None), 0.0, 1, id="missing-costs-as-zero"),
+            # Grouped query fails: 1 resource × $2.00 via a per-resource lookup
+            pytest.param(([_disk("DISK1")], None, 2.0), 2.0, 1, id="per-resource-fallback"),
+        ],
+        indirect=["graph_scanner"],
+    )
+    async def test_total_cost(self, graph_scanner, expected_total, expected_fallback_calls):
+        result = await graph_scanner.scan(days=30)
+
+        assert result["total_estimated_cost"] == expected_total
         assert result["lookback_days"] == 30
+        # One grouped cost query for the single subscription
+        graph_scanner._get_resource_costs_bulk.assert_awaited_once()
+        assert graph_scanner._get_resource_cost.await_count == expected_fallback_calls
+
+    @pytest.mark.parametrize("scan_kwargs", [{"skip_cost": True}, {"days": 0}])
+    async def test_skip_cost_makes_no_cost_lookups(self, scanner, scan_kwargs):
+        scanner._get_subscriptions = _counting_stub([{"id": "sub-1", "name": "Test"}])
+        scanner._execute_resource_graph_query = _counting_stub({"data": [_disk("disk1")]})
+        scanner._get_resource_costs_bulk = AsyncMock()
+        scanner._get_resource_cost = AsyncMock()
+
+        result = await scanner.scan(**scan_kwargs)
+
+        scanner._get_resource_costs_bulk.assert_not_awaited()
+        scanner._get_resource_cost.assert_not_awaited()
+        resources = result["subscriptions"][0]["orphaned_resources"]
+        assert all(r["estimated_cost_usd"] is None for r in resources)
+        assert result["total_estimated_cost"] == 0.0
+        assert result["cost_skipped"] is True
+        assert "Cost lookup was skipped" in result["note"]
 
-    @pytest.mark.asyncio
-    async def test_cost_none_treated_as_zero(self, scanner):
-        """If cost lookup returns None, total should not blow up."""
-        subs = [{"id": "sub-1", "name": "Test"}]
-        scanner._get_subscriptions = AsyncMock(return_value=subs)
-        scanner._execute_resource_graph_query = AsyncMock(
-            return_value={
-                "data": [
-                    {
-                        "id": "/subs/sub-1/rg/rg1/providers/x/disk1",
-                        "name": "disk1",
-                        "type": "microsoft.compute/disks",
-                        "location": "eastus",
-                        "resourceGroup": "rg1",
-                        "subscriptionId": "sub-1",
-                    }
-                ]
+        output = format_orphaned_resources_response(result)
+        assert "$0.00" not in output
+        assert "| Unattached Disk | 1 | N/A |" in output
+
+    async def test_costs_are_reused_across_scans(self, scanner):
+        scanner._get_resource_costs_bulk = AsyncMock(
+            side_effect=lambda sub_id, ids, days: {rid.lower(): 1.0 for rid in ids if "missing" not in rid}
+        )
+
+        first = await scanner._get_subscription_costs("sub-1", ["/x/disk1", "/x/missing"], 30)
+        second = await scanner._get_subscription_costs("sub-1", ["/x/DISK1", "/x/disk2"], 30)
+
+        assert first == [1.0, 0.0]
+        assert second == [1.0, 1.0]
+        # disk1 was served from the cache; only disk2 needed a second query
+        assert scanner._get_resource_costs_bulk.call_args_list[1].args[1] == ["/x/disk2"]
+
+    @pytest.mark.parametrize("status", [401, 403, 429, 503])
+    async def test_unavailable_bulk_query_skips_per_resource_fallback(self, scanner, fake_http, status):
+        """A throttled or unauthorized grouped query leaves costs unavailable instead of retrying per resource."""
+        tracker = fake_http(status=status)
+        scanner._get_resource_cost = _counting_stub(1.0)
+
+        costs = await scanner._get_subscription_costs("sub-1", ["/x/disk1", "/x/disk2"], 30)
+
+        assert costs == [None, None]
+        assert tracker["calls"] == 1
+        assert scanner._get_resource_cost.count == 0
+        assert not scanner._cost_cache
+
+    async def test_failed_bulk_query_falls_back_per_resource(self, scanner, fake_http):
+        fake_http(status=500)
+        scanner._get_resource_cost = _counting_stub(1.0)
+
+        costs = await scanner._get_subscription_costs("sub-1", ["/x/disk1", "/x/disk2"], 30)
+
+        assert costs == [1.0, 1.0]
+        assert scanner._get_resource_cost.count == 2
+
+    async def test_expired_costs_are_evicted(self, scanner):
+        scanner._get_resource_costs_bulk = _counting_stub({"/x/disk1": 1.0})
+        scanner._cost_cache[("sub-1", "/x/gone", 30)] = (datetime.now() - COST_CACHE_TTL, 2.0)
+
+        await scanner._get_subscription_costs("sub-1", ["/x/disk1"], 30)
+
+        assert list(scanner._cost_cache) == [("sub-1", "/x/disk1", 30)]
+
+    async def test_bulk_cost_lookups_are_chunked(self, scanner):
+        resource_ids = [f"/subs/sub-1/x/disk{i}" for i in range(MAX_RESOURCES_PER_COST_QUERY + 1)]
+        scanner._get_resource_costs_bulk = AsyncMock(
+            side_effect=lambda sub_id, ids, days: {rid.lower(): 1.0 for rid in ids}
+        )
+
+        costs = await scanner._get_subscription_costs("sub-1", resource_ids, 30)
+
+        assert costs == [1.0] * len(resource_ids)
+        chunk_sizes = [len(call.args[1]) for call in scanner._get_resource_costs_bulk.call_args_list]
+        assert chunk_sizes == [MAX_RESOURCES_PER_COST_QUERY, 1]
+
+    @pytest.mark.parametrize(
+        "graph_scanner",
+        [
+            (
+                [
+                    {**_disk("Disk1"), "id": "/subs/sub-1/rg/RG1/providers/x/Disk1"},
+                    {**_disk("Disk2"), "id": "/subs/sub-1/rg/RG1/providers/x/Disk2"},
+                ],
+                {"/subs/sub-1/rg/rg1/providers/x/disk1": 3.0},
+                None,
+            )
+        ],
+        indirect=True,
+    )
+    async def test_bulk_cost_matches_resource_ids_case_insensitively(self, graph_scanner):
+        """Cost Management returns lower-cased IDs; resources without rows cost 0."""
+        result = await graph_scanner.scan()
+        costs = [r["estimated_cost_usd"] for r in result["subscriptions"][0]["orphaned_resources"]]
+        assert costs == [3.0, 0.0]
+
+    async def test_bulk_cost_query_parses_grouped_rows(self, scanner, fake_http):
+        """The grouped Cost Management response is keyed by lower-cased resource ID."""
+        payload = {
+            "properties": {
+                "columns": [{"name": "Cost"}, {"name": "ResourceId"}, {"name": "Currency"}],
+                "rows": [
+                    [4.25, "/subs/sub-1/rg/rg1/providers/x/disk1", "USD"],
+                    [1.5, "/subs/sub-1/rg/rg1/providers/x/ip1", "USD"],
+                ],
             }
+        }
+        fake_http(payload)
+
+        costs = await scanner._get_resource_costs_bulk(
+            "sub-1", ["/subs/sub-1/rg/RG1/providers/x/Disk1", "/subs/sub-1/rg/rg1/providers/x/ip1"], 30
         )
-        scanner._get_resource_cost = AsyncMock(return_value=None)
 
-        result = await scanner.scan()
-        assert result["total_estimated_cost"] == 0.0
+        assert costs == {
+            "/subs/sub-1/rg/rg1/providers/x/disk1": 4.25,
+            "/subs/sub-1/rg/rg1/providers/x/ip1": 1.5,
+        }
+        # Costs are cached per resource by _get_subscription_costs, not as whole query results
+        assert not scanner._result_cache
 
 
 # ---------------------------------------------------------------------------
@@ -254,7 +786,6 @@ class TestScannerCostLookup:
 
 
 class TestOrphanedResourcesService:
-    @pytest.mark.asyncio
     async def test_delegates_to_scanner(self, service):
         """Service.find_orphaned_resources must await the scanner."""
         expected = {
@@ -266,10 +797,14 @@ class TestOrphanedResourcesService:
         service._scanner.scan = AsyncMock(return_value=expected)
 
         result = await service.find_orphaned_resources(days=30, all_subscriptions=False)
-        service._scanner.scan.assert_awaited_once_with(days=30, all_subscriptions=False)
+        service._scanner.scan.assert_awaited_once_with(days=30, all_subscriptions=False, skip_cost=False)
         assert result == expected
 
-    @pytest.mark.asyncio
+    async def test_passes_skip_cost_flag(self, service):
+        service._scanner.scan = AsyncMock(return_value={"total_orphaned": 0, "subscriptions": []})
+        await service.find_orphaned_resources(skip_cost=True)
+        assert service._scanner.scan.call_args.kwargs["skip_cost"] is True
+
     async def test_passes_all_subscriptions_flag(self, service):
         """Service must thread through the all_subscriptions parameter (review #2)."""
         service._scanner.scan = AsyncMock(return_value={"total_orphaned": 0, "subscriptions": []})
@@ -389,46 +924,100 @@ class TestFormatter:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def _orphan_service_spec():
+    """Build the spec'd service mock once; spec introspection is the costly part."""
+    return AsyncMock(spec=OrphanedResourcesService)
+
+
+@pytest.fixture
+def orphan_service(_orphan_service_spec):
+    """Module-shared OrphanedResourcesService mock, reset for each test."""
+    _orphan_service_spec.reset_mock(return_value=True, side_effect=True)
+    return _orphan_service_spec
+
+
+@pytest.fixture(scope="module")
+def _shared_tool_handlers():
+    return ToolHandlers(MagicMock(), MagicMock())
+
+
+@pytest.fixture
+def tool_handlers(_shared_tool_handlers):
+    """Module-shared ToolHandlers with the lazily created orphan service cleared."""
+    _shared_tool_handlers._orphaned_service = None
+    return _shared_tool_handlers
+
+
 class TestHandler:
-    @pytest.mark.asyncio
-    async def test_handler_exists_on_tool_handlers(self):
+    async def test_handler_exists_on_tool_handlers(self, tool_handlers):
         """ToolHandlers must expose handle_find_orphaned_resources."""
-        pricing = MagicMock()
-        sku = MagicMock()
-        handlers = ToolHandlers(pricing, sku)
-        assert hasattr(handlers, "handle_find_orphaned_resources")
+        assert hasattr(tool_handlers, "handle_find_orphaned_resources")
 
-    @pytest.mark.asyncio
-    async def test_handler_returns_text_content(self):
+    async def test_handler_returns_text_content(self, tool_handlers, orphan_service):
         """Handler must return a list of TextContent."""
-        pricing = MagicMock()
-        sku = MagicMock()
-        mock_orphaned = MagicMock()
-        mock_orphaned.find_orphaned_resources = AsyncMock(
-            return_value={
-                "subscriptions": [],
-                "total_orphaned": 0,
-                "total_estimated_cost": 0.0,
-                "lookback_days": 60,
-                "currency": "USD",
-            }
-        )
-        handlers = ToolHandlers(pricing, sku, orphaned_service=mock_orphaned)
-        result = await handlers.handle_find_orphaned_resources({"days": 30, "all_subscriptions": False})
+        orphan_service.find_orphaned_resources.return_value = {
+            "subscriptions": [],
+            "total_orphaned": 0,
+            "total_estimated_cost": 0.0,
+            "lookback_days": 60,
+            "currency": "USD",
+        }
+        tool_handlers._orphaned_service = orphan_service
+        result = await tool_handlers.handle_find_orphaned_resources({"days": 30, "all_subscriptions": False})
         assert len(result) == 1
         assert result[0].type == "text"
         assert "No Orphaned Resources Found" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_handler_lazy_creates_service(self):
+    async def test_handler_json_format_returns_raw_result(self, tool_handlers, orphan_service):
+        """format=json skips the markdown report and returns the scan result as JSON."""
+        scan_result = {
+            "subscriptions": [
+                {"subscription_id": "sub-1", "orphaned_resources": [{"name": "disk1", "estimated_cost_usd": None}]}
+            ],
+            "total_orphaned": 1,
+        }
+        orphan_service.find_orphaned_resources.return_value = scan_result
+        tool_handlers._orphaned_service = orphan_service
+        result = await tool_handlers.handle_find_orphaned_resources({"format": "json"})
+        assert json.loads(result[0].text) == scan_result
+
+    async def test_handler_json_format_flags_skipped_costs(self, tool_handlers, service):
+        """A skip_cost scan serialized as JSON says so, rather than reporting zero cost."""
+        service._scanner._get_subscriptions = _counting_stub([{"id": "sub-1", "name": "Test"}])
+        service._scanner._execute_resource_graph_query = _counting_stub({"data": [_disk("disk1")]})
+        tool_handlers._orphaned_service = service
+
+        result = await tool_handlers.handle_find_orphaned_resources({"format": "json", "skip_cost": True})
+
+        payload = json.loads(result[0].text)
+        assert payload["cost_skipped"] is True
+        assert payload["subscriptions"][0]["orphaned_resources"][0]["estimated_cost_usd"] is None
+
+    @pytest.mark.parametrize(
+        ("arguments", "expected"),
+        [
+            ({}, {"days": 60, "all_subscriptions": True, "skip_cost": False}),
+            (
+                {"days": 90, "all_subscriptions": False, "skip_cost": True},
+                {"days": 90, "all_subscriptions": False, "skip_cost": True},
+            ),
+        ],
+        ids=["defaults", "custom"],
+    )
+    async def test_handler_forwards_arguments(self, tool_handlers, orphan_service, arguments, expected):
+        """Handler passes tool arguments, or their defaults, through to the service."""
+        orphan_service.find_orphaned_resources.return_value = {"subscriptions": [], "total_orphaned": 0}
+        tool_handlers._orphaned_service = orphan_service
+        await tool_handlers.handle_find_orphaned_resources(arguments)
+        orphan_service.find_orphaned_resources.assert_awaited_once_with(**expected)
+
+    async def test_handler_lazy_creates_service(self, tool_handlers):
         """If no orphaned_service provided, handler should create one lazily."""
-        pricing = MagicMock()
-        sku = MagicMock()
-        handlers = ToolHandlers(pricing, sku)
-        svc = handlers._get_orphaned_service()
+        svc = tool_handlers._get_orphaned_service()
         assert isinstance(svc, OrphanedResourcesService)
         # Second call returns same instance
-        assert handlers._get_orphaned_service() is svc
+        assert tool_handlers._get_orphaned_service() is svc
 
 
 # ---------------------------------------------------------------------------
@@ -1,6 +1,6 @@
 """Tests for Reserved Instance pricing functionality."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -10,21 +10,22 @@ from azure_pricing_mcp.services.retirement import RetirementService
 
 
 @pytest.fixture
-async def services():
-    """Create pricing service for testing."""
-    async with AzurePricingClient() as client:
-        retirement_service = RetirementService(client)
-        pricing_service = PricingService(client, retirement_service)
-        yield {"pricing": pricing_service, "client": client}
+def services():
+    """Build the pricing service around a stub client.
+
+    The test mocks fetch_prices, so it needs no HTTP session; this overrides
+    the session-wide live-client fixture from conftest.
+    """
+    client = MagicMock(spec=AzurePricingClient)
+    return {"client": client, "pricing": PricingService(client, RetirementService(client))}
 
 
-@pytest.mark.asyncio
 async def test_get_ri_pricing(services):
     """Test RI pricing with comparison to on-demand."""
-    # Mock RI response
+    # Mock RI and on-demand responses
     with patch.object(services["client"], "fetch_prices", new_callable=AsyncMock) as mock_request:
-        mock_request.side_effect = [
-            {
+        responses = {
+            "Reservation": {
                 "Items": [
                     {
                         "skuName": "D4s v3",
@@ -35,7 +36,7 @@ async def test_get_ri_pricing(services):
                     }
                 ]
             },
-            {
+            "Consumption": {
                 "Items": [
                     {
                         "skuName": "D4s v3",
@@ -46,7 +47,9 @@ async def test_get_ri_pricing(services):
                     }
                 ]
             },
-        ]
+        }
+        # RI and on-demand prices are fetched concurrently, so answer by price type, not call order
+        mock_request.side_effect = lambda filter_conditions, **kwargs: responses[filter_conditions[0].split("'")[1]]
 
         result = await services["pricing"].get_ri_pricing(
             service_name="Virtual Machines",
@@ -59,3 +62,4 @@ async def test_get_ri_pricing(services):
         assert "comparison" in result
         comp = result["comparison"][0]
         assert comp["sku"] == "D4s v3"
+        assert mock_request.call_count == 2
@@ -0,0 +1,78 @@
+"""Unit tests for SpotService HTTP session handling."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from azure_pricing_mcp.services.spot import SpotService
+
+
+class _FakeResponse:
+    """Minimal aiohttp response stand-in returning an empty Resource Graph result."""
+
+    status = 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def json(self, **kwargs):
+        return {"data": []}
+
+
+class _FakeSession:
+    """Minimal aiohttp.ClientSession stand-in that records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    def post(self, url, **kwargs):
+        return _FakeResponse()
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Route SpotService's aiohttp sessions to _FakeSession and list every one created."""
+    created = []
+
+    def make_session(*args, **kwargs):
+        created.append(_FakeSession())
+        return created[-1]
+
+    monkeypatch.setattr("azure_pricing_mcp.services.spot.aiohttp.ClientSession", make_session)
+    return created
+
+
+@pytest.fixture
+def spot_service():
+    credential_manager = MagicMock()
+    credential_manager.get_token.return_value = "fake-token"
+    return SpotService(credential_manager=credential_manager)
+
+
+class TestSpotServiceSession:
+    async def test_requests_share_one_session_until_closed(self, spot_service, sessions):
+        await spot_service._execute_resource_graph_query("SpotResources | take 1")
+        await spot_service._execute_resource_graph_query("SpotResources | take 2")
+        assert len(sessions) == 1
+
+        await spot_service.aclose()
+        assert sessions[0].closed
+
+    async def test_new_session_after_close(self, spot_service, sessions):
+        await spot_service._execute_resource_graph_query("SpotResources | take 1")
+        await spot_service.aclose()
+
+        await spot_service._execute_resource_graph_query("SpotResources | take 1")
+
+        assert len(sessions) == 2
+        assert not sessions[1].closed
+
+    async def test_aclose_without_requests_is_a_no_op(self, spot_service, sessions):
+        await spot_service.aclose()
+        assert sessions == []